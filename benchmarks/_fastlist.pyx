@@ -0,0 +1,26 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional compiled helper for the list[complex] compatibility path.
+
+Build in place with ``cythonize -i benchmarks/_fastlist.pyx``; the
+benchmark driver falls back to ``ndarray.tolist()`` when the extension
+is absent. The win over ``.tolist()`` comes from preallocating the list
+with ``PyList_New`` and storing via ``PyList_SET_ITEM`` (which steals
+the reference, skipping a refcount round-trip per element).
+"""
+
+from cpython.complex cimport PyComplex_FromDoubles
+from cpython.list cimport PyList_New, PyList_SET_ITEM
+from cpython.ref cimport Py_INCREF
+
+
+def buf_to_list(double[::1] interleaved):
+    """Convert an interleaved real/imag float64 buffer to list[complex]."""
+    cdef Py_ssize_t n = interleaved.shape[0] // 2
+    cdef list out = PyList_New(n)
+    cdef Py_ssize_t i
+    cdef object value
+    for i in range(n):
+        value = PyComplex_FromDoubles(interleaved[2 * i], interleaved[2 * i + 1])
+        Py_INCREF(value)
+        PyList_SET_ITEM(out, i, value)
+    return out
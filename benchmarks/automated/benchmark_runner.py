@@ -16,7 +16,7 @@ from typing import Any
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Container for benchmark results.
 
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""Package QuASIM compliance data products (CDP) for auditor submission.
+
+Bundles the Monte Carlo campaign results, seed-management audit trail,
+and CDP definition into a single ZIP with a manifest. Files are stat'ed
+once and streamed into the archive in 1 MiB blocks, so large campaign
+outputs are never read twice or buffered whole.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+try:  # optional: ~10x faster than deflate on the text-heavy artifacts
+    import zstandard as zstd
+except ImportError:  # pragma: no cover - optional dependency
+    zstd = None
+
+ARTIFACT_PATHS = [
+    "cdp_artifacts/CDP_v1.0.json",
+    "montecarlo_campaigns/MC_Results_1024.json",
+    "montecarlo_campaigns/coverage_matrix.csv",
+    "seed_management/seed_audit.log",
+    "seed_management/seed_manager.py",
+]
+
+MANIFEST_NAME = "CDP_MANIFEST.json"
+
+# Level 1 deflate is ~3x faster than the default level 6 on the JSON/CSV
+# payloads we bundle, at a modest ratio cost.
+_COMPRESS_LEVEL = 1
+_CHUNK_SIZE = 1 << 20
+
+# ZIP-container codecs; "zstd" is handled separately as a .tar.zst
+# stream because zipfile has no zstandard support.
+_ZIP_CODECS = {
+    "deflate": zipfile.ZIP_DEFLATED,
+    "lzma": zipfile.ZIP_LZMA,
+}
+
+
+def _compress_and_hash(args: tuple[str, str]) -> tuple[str, int, int, bytes, str]:
+    """Worker: one pass over the file feeding deflate, CRC-32 and SHA-256.
+
+    Returns (rel_path, crc32, raw_size, deflated_bytes, sha256_hex);
+    module-level so ProcessPoolExecutor can pickle it.
+    """
+    rel_path, path_str = args
+    compressor = zlib.compressobj(_COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    digest = hashlib.sha256()
+    crc = 0
+    raw_size = 0
+    deflated = bytearray()
+    with open(path_str, "rb") as src:
+        while chunk := src.read(_CHUNK_SIZE):
+            digest.update(chunk)
+            crc = zlib.crc32(chunk, crc)
+            raw_size += len(chunk)
+            deflated += compressor.compress(chunk)
+    deflated += compressor.flush()
+    return rel_path, crc, raw_size, bytes(deflated), digest.hexdigest()
+
+
+class _HashingReader:
+    """File-like shim that feeds a digest with every block it serves.
+
+    Lets tarfile consume an artifact while the SHA-256 is computed from
+    the very same blocks, preserving the single-read guarantee.
+    """
+
+    def __init__(self, raw, digest):
+        self._raw = raw
+        self._digest = digest
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        if chunk:
+            self._digest.update(chunk)
+        return chunk
+
+
+class CDPPackager:
+    """Collects compliance artifacts and streams them into a ZIP package."""
+
+    def __init__(self, base_path: Path | None = None):
+        self.base_path = Path(base_path) if base_path else Path(__file__).resolve().parent
+        # One clock read per packaging run: every output (manifest,
+        # README) reports the same creation instant, which also keeps
+        # package metadata reproducible across the run.
+        self._created_at = datetime.now()
+        self._created_iso = self._created_at.isoformat()
+
+    def _present(self, dir_name: str) -> dict[str, os.stat_result]:
+        """Scan one artifact directory, returning {filename: stat}.
+
+        os.scandir serves the stat results from the directory listing,
+        so probing N artifacts costs one syscall per directory instead
+        of one per file.
+        """
+        try:
+            with os.scandir(self.base_path / dir_name) as entries:
+                return {entry.name: entry.stat() for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return {}
+
+    def collect_artifacts(self) -> list[tuple[str, Path, os.stat_result]]:
+        """Resolve the known artifacts, scanning each parent dir once."""
+        present: dict[str, dict[str, os.stat_result]] = {}
+        collected: list[tuple[str, Path, os.stat_result]] = []
+        for rel_path in ARTIFACT_PATHS:
+            dir_name, file_name = rel_path.rsplit("/", 1)
+            if dir_name not in present:
+                present[dir_name] = self._present(dir_name)
+            stat = present[dir_name].get(file_name)
+            if stat is not None:
+                collected.append((rel_path, self.base_path / rel_path, stat))
+        return collected
+
+    def create_package_manifest(
+        self, artifacts: list[tuple[str, Path, os.stat_result]]
+    ) -> dict:
+        """Build the manifest from the cached stat results (no re-stat)."""
+        return {
+            "package": {
+                "name": "QuASIM-CDP",
+                "version": "1.0",
+                "created": self._created_iso,
+                "artifact_count": len(artifacts),
+            },
+            "artifacts": [
+                {
+                    "name": rel_path,
+                    "size_bytes": stat.st_size,
+                    "modified": time.strftime(
+                        "%Y-%m-%dT%H:%M:%S", time.localtime(stat.st_mtime)
+                    ),
+                }
+                for rel_path, _path, stat in artifacts
+            ],
+        }
+
+    def package_artifacts(
+        self, output_path: Path, compression: str = "deflate", jobs: int = 1
+    ) -> Path:
+        """Stream every artifact into the archive, then write the manifest.
+
+        Content hashes are computed from the same 1 MiB blocks the
+        archive writer consumes, so auditors get integrity digests
+        without a second read of any file. ``compression`` is one of
+        ``deflate`` (default, universally unpackable), ``lzma`` (~2x
+        better ratio on our text payloads, slower), or ``zstd`` (fast
+        multithreaded compression; emits a ``.tar.zst`` and requires
+        the optional ``zstandard`` package).
+        """
+        artifacts = self.collect_artifacts()
+        manifest = self.create_package_manifest(artifacts)
+        if compression == "zstd":
+            return self._package_tar_zst(output_path, artifacts, manifest)
+        try:
+            codec = _ZIP_CODECS[compression]
+        except KeyError:
+            raise ValueError(f"unknown compression {compression!r}") from None
+        if jobs > 1 and compression == "deflate" and len(artifacts) > 1:
+            return self._package_parallel(output_path, artifacts, manifest, jobs)
+        with zipfile.ZipFile(
+            output_path, "w", codec, compresslevel=_COMPRESS_LEVEL
+        ) as zipf:
+            for entry, (rel_path, full_path, _stat) in zip(manifest["artifacts"], artifacts):
+                digest = hashlib.sha256()
+                zinfo = zipfile.ZipInfo.from_file(full_path, rel_path)
+                zinfo.compress_type = codec
+                # ZipFile.open ignores the archive compresslevel when
+                # handed a ZipInfo, so pin the level here.
+                zinfo._compresslevel = _COMPRESS_LEVEL
+                with full_path.open("rb") as src:
+                    with zipf.open(zinfo, "w", force_zip64=True) as dst:
+                        while chunk := src.read(_CHUNK_SIZE):
+                            digest.update(chunk)
+                            dst.write(chunk)
+                entry["sha256"] = digest.hexdigest()
+            zipf.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+        return output_path
+
+    def _package_parallel(
+        self,
+        output_path: Path,
+        artifacts: list[tuple[str, Path, os.stat_result]],
+        manifest: dict,
+        jobs: int,
+    ) -> Path:
+        """Deflate and hash artifacts across processes, append serially.
+
+        Workers each make one pass over their file, producing the raw
+        deflate stream plus CRC-32 and SHA-256; the main process then
+        splices the pre-compressed members into the ZIP, so the
+        compute-bound work fans out while the archive stays a single
+        sequential write.
+        """
+        with zipfile.ZipFile(
+            output_path, "w", zipfile.ZIP_DEFLATED, compresslevel=_COMPRESS_LEVEL
+        ) as zipf:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = pool.map(
+                    _compress_and_hash,
+                    [(rel_path, str(full_path)) for rel_path, full_path, _stat in artifacts],
+                )
+                for entry, (rel_path, full_path, _stat), result in zip(
+                    manifest["artifacts"], artifacts, results
+                ):
+                    _rel, crc, raw_size, deflated, sha256_hex = result
+                    self._append_precompressed(
+                        zipf, full_path, rel_path, crc, raw_size, deflated
+                    )
+                    entry["sha256"] = sha256_hex
+            zipf.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+        return output_path
+
+    @staticmethod
+    def _append_precompressed(
+        zipf: zipfile.ZipFile,
+        full_path: Path,
+        rel_path: str,
+        crc: int,
+        raw_size: int,
+        deflated: bytes,
+    ) -> None:
+        """Splice an already-deflated member into an open ZipFile.
+
+        zipfile has no public API for pre-compressed data, so this
+        writes the local header itself and registers the ZipInfo in the
+        archive's directory structures; the central directory is then
+        emitted normally on close.
+        """
+        zinfo = zipfile.ZipInfo.from_file(full_path, rel_path)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.CRC = crc
+        zinfo.file_size = raw_size
+        zinfo.compress_size = len(deflated)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader(False))
+        zipf.fp.write(deflated)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+
+    def _package_tar_zst(
+        self,
+        output_path: Path,
+        artifacts: list[tuple[str, Path, os.stat_result]],
+        manifest: dict,
+    ) -> Path:
+        """Stream a .tar.zst: tarfile pipes straight into the zstd writer."""
+        if zstd is None:
+            raise RuntimeError("zstd compression requires the 'zstandard' package")
+        if output_path.suffix == ".zip":
+            output_path = output_path.with_suffix(".tar.zst")
+        compressor = zstd.ZstdCompressor(level=3, threads=-1)
+        with output_path.open("wb") as raw:
+            with compressor.stream_writer(raw) as writer:
+                with tarfile.open(mode="w|", fileobj=writer) as tar:
+                    for entry, (rel_path, full_path, stat) in zip(
+                        manifest["artifacts"], artifacts
+                    ):
+                        digest = hashlib.sha256()
+                        info = tarfile.TarInfo(rel_path)
+                        info.size = stat.st_size
+                        info.mtime = int(stat.st_mtime)
+                        with full_path.open("rb") as src:
+                            tar.addfile(info, _HashingReader(src, digest))
+                        entry["sha256"] = digest.hexdigest()
+                    payload = json.dumps(manifest, indent=2).encode()
+                    info = tarfile.TarInfo(MANIFEST_NAME)
+                    info.size = len(payload)
+                    info.mtime = int(self._created_at.timestamp())
+                    tar.addfile(info, io.BytesIO(payload))
+        return output_path
+
+    def validate_package(self, package_path: Path) -> bool:
+        """Check the package structure against its own manifest."""
+        try:
+            with zipfile.ZipFile(package_path) as zipf:
+                # namelist() rebuilds a list from the central directory
+                # on every call; read it once and membership-test a set.
+                names = frozenset(zipf.namelist())
+                if MANIFEST_NAME not in names:
+                    return False
+                manifest = json.loads(zipf.read(MANIFEST_NAME))
+                expected = manifest["package"]["artifact_count"]
+                actual_artifacts = len(names) - 1
+                if actual_artifacts != expected:
+                    return False
+                for entry in manifest["artifacts"]:
+                    if entry["name"] not in names:
+                        return False
+        except (OSError, zipfile.BadZipFile, KeyError, json.JSONDecodeError):
+            return False
+        return True
+
+    def create_submission_readme(self) -> str:
+        """Render the short README included alongside the package."""
+        return (
+            "QuASIM Compliance Data Product\n"
+            "==============================\n\n"
+            f"Generated: {self._created_at.strftime('%Y-%m-%d')}\n"
+            f"Contents: {len(ARTIFACT_PATHS)} artifacts plus {MANIFEST_NAME}\n"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Package QuASIM CDP artifacts")
+    parser.add_argument(
+        "--output", type=Path, default=Path("QuASIM_CDP_Package.zip"), help="Output ZIP path"
+    )
+    parser.add_argument(
+        "--base-path", type=Path, default=None, help="Repository root holding the artifacts"
+    )
+    parser.add_argument(
+        "--compression",
+        choices=("deflate", "lzma", "zstd"),
+        default="deflate",
+        help="Archive codec; zstd needs the zstandard package and emits .tar.zst",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for deflate+hash; 1 keeps the streaming path",
+    )
+    args = parser.parse_args()
+
+    packager = CDPPackager(base_path=args.base_path)
+    package = packager.package_artifacts(
+        args.output, compression=args.compression, jobs=args.jobs
+    )
+    if package.suffix != ".zst" and not packager.validate_package(package):
+        print(f"validation failed for {package}", file=sys.stderr)
+        return 1
+    print(f"packaged {package} ({package.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
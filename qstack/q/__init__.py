@@ -1,39 +1,41 @@
 """Deterministic identity, sovereignty, and provenance utilities for Q-Stack."""
 
-from .attestation import Attestor
-from .crypto import (
-    CapabilityAuthority,
-    DeterministicAccessControlList,
-    DeterministicCapabilityToken,
-    DeterministicKeyExchange,
-    DeterministicLedger,
-    DeterministicMerkleTree,
-    DeterministicRevocationList,
-    SovereignClusterReplication,
-)
-from .identity import QIdentity
-from .keys import KeyManager
-from .ledger import Ledger
-from .registry import IdentityRegistry
-from .signing import Signer
-from .sovereignty import SovereignObject
-from .trust_graph import TrustGraph
-
-__all__ = [
-    "KeyManager",
-    "Signer",
-    "QIdentity",
-    "SovereignObject",
-    "Attestor",
-    "TrustGraph",
-    "IdentityRegistry",
-    "Ledger",
-    "DeterministicMerkleTree",
-    "DeterministicLedger",
-    "DeterministicKeyExchange",
-    "DeterministicAccessControlList",
-    "DeterministicCapabilityToken",
-    "CapabilityAuthority",
-    "DeterministicRevocationList",
-    "SovereignClusterReplication",
-]
+from __future__ import annotations
+
+import importlib
+
+# Symbol -> defining submodule, resolved on first attribute access
+# (PEP 562) so importing the package doesn't pull in every submodule.
+_LAZY = {
+    "KeyManager": ".keys",
+    "Signer": ".signing",
+    "QIdentity": ".identity",
+    "SovereignObject": ".sovereignty",
+    "Attestor": ".attestation",
+    "TrustGraph": ".trust_graph",
+    "IdentityRegistry": ".registry",
+    "Ledger": ".ledger",
+    "DeterministicMerkleTree": ".crypto",
+    "DeterministicLedger": ".crypto",
+    "DeterministicKeyExchange": ".crypto",
+    "DeterministicAccessControlList": ".crypto",
+    "DeterministicCapabilityToken": ".crypto",
+    "CapabilityAuthority": ".crypto",
+    "DeterministicRevocationList": ".crypto",
+    "SovereignClusterReplication": ".crypto",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -5,21 +5,34 @@ still offering integrity, provenance, and access-control guarantees suitable
 for deterministic pipelines.
 """
 
-from .deterministic_acl import DeterministicAccessControlList
-from .deterministic_capability import CapabilityAuthority, DeterministicCapabilityToken
-from .deterministic_kex import DeterministicKeyExchange
-from .deterministic_ledger import DeterministicLedger
-from .deterministic_merkle import DeterministicMerkleTree
-from .deterministic_revocation import DeterministicRevocationList
-from .sovereign_cluster import SovereignClusterReplication
-
-__all__ = [
-    "DeterministicMerkleTree",
-    "DeterministicLedger",
-    "DeterministicKeyExchange",
-    "DeterministicAccessControlList",
-    "DeterministicCapabilityToken",
-    "CapabilityAuthority",
-    "DeterministicRevocationList",
-    "SovereignClusterReplication",
-]
+from __future__ import annotations
+
+import importlib
+
+# Symbol -> defining submodule, resolved on first attribute access
+# (PEP 562) so importing the package doesn't pull in every submodule.
+_LAZY = {
+    "DeterministicMerkleTree": ".deterministic_merkle",
+    "DeterministicLedger": ".deterministic_ledger",
+    "DeterministicKeyExchange": ".deterministic_kex",
+    "DeterministicAccessControlList": ".deterministic_acl",
+    "DeterministicCapabilityToken": ".deterministic_capability",
+    "CapabilityAuthority": ".deterministic_capability",
+    "DeterministicRevocationList": ".deterministic_revocation",
+    "SovereignClusterReplication": ".sovereign_cluster",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,8 +1,16 @@
 import hashlib
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Sequence
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=64)
+def _seed_prefix(seed: str) -> bytes:
+    """Pre-encoded ``"{seed}:"`` prefix shared by every derivation."""
+    return f"{seed}:".encode()
+
+
+@dataclass(frozen=True, slots=True)
 class KeyManager:
     """
     Deterministic key derivation from a root seed using SHA-256.
@@ -12,5 +20,29 @@ class KeyManager:
     seed: str
 
     def derive_key(self, name: str) -> str:
-        payload = f"{self.seed}:{name}".encode()
-        return hashlib.sha256(payload).hexdigest()
+        return hashlib.sha256(_seed_prefix(self.seed) + name.encode()).hexdigest()
+
+    def derive_keys(self, names: Sequence[str]) -> list[str]:
+        """Derive many subkeys, amortizing prefix encoding across the batch."""
+        prefix = _seed_prefix(self.seed)
+        sha256 = hashlib.sha256
+        return [sha256(prefix + name.encode()).hexdigest() for name in names]
+
+    def derive_key_prefixed(self, prefix: bytes, suffixes: Iterable[bytes]) -> list[str]:
+        """Derive keys for names sharing ``prefix``, varying only in suffix.
+
+        The SHA-256 state is primed once with ``"{seed}:" + prefix`` and
+        cloned per suffix, so the shared compression rounds are computed
+        a single time for the whole batch. Equivalent to calling
+        :meth:`derive_key` with ``(prefix + suffix).decode()`` for each
+        suffix, but cheaper whenever the shared portion spans one or
+        more 64-byte blocks.
+        """
+        base = hashlib.sha256(_seed_prefix(self.seed) + prefix)
+        keys: list[str] = []
+        append = keys.append
+        for suffix in suffixes:
+            h = base.copy()
+            h.update(suffix)
+            append(h.hexdigest())
+        return keys
@@ -1,22 +1,36 @@
 """Deterministic runtime substrate for Q-Stack."""
 
-from .runtime.operators import Operator, OperatorLibrary
-from .runtime.safety import RateLimiter, SafetyConstraints, SafetyEnvelope, SafetyValidator
-from .runtime.scheduler import DeterministicScheduler, PriorityScheduler
-from .runtime.state import QNXState
-from .runtime.tracing import TraceRecorder
-from .runtime.vm import QNXVM
-
-__all__ = [
-    "QNXState",
-    "Operator",
-    "OperatorLibrary",
-    "DeterministicScheduler",
-    "PriorityScheduler",
-    "SafetyConstraints",
-    "SafetyEnvelope",
-    "SafetyValidator",
-    "RateLimiter",
-    "TraceRecorder",
-    "QNXVM",
-]
+from __future__ import annotations
+
+import importlib
+
+# Symbol -> defining submodule, resolved on first attribute access
+# (PEP 562) so importing the package doesn't pull in every submodule.
+_LAZY = {
+    "QNXState": ".runtime.state",
+    "Operator": ".runtime.operators",
+    "OperatorLibrary": ".runtime.operators",
+    "DeterministicScheduler": ".runtime.scheduler",
+    "PriorityScheduler": ".runtime.scheduler",
+    "SafetyConstraints": ".runtime.safety",
+    "SafetyEnvelope": ".runtime.safety",
+    "SafetyValidator": ".runtime.safety",
+    "RateLimiter": ".runtime.safety",
+    "TraceRecorder": ".runtime.tracing",
+    "QNXVM": ".runtime.vm",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,37 +1,45 @@
 """Deterministic runtime substrate for Q-Stack."""
 
-from .checkpoint import Checkpoint, CheckpointManager
-from .fault_isolation import FaultIsolationZones
-from .graph_vm import FaultIsolationZone, GraphVM, OperatorGraph
-from .operators import Operator, OperatorLibrary
-from .replay_buffer import DeterministicReplayBuffer
-from .safety import RateLimiter, SafetyConstraints, SafetyEnvelope, SafetyValidator
-from .scheduler import DeterministicScheduler, PriorityScheduler
-from .state import QNXState
-from .state_delta import compute_delta
-from .ticks import TickCounter
-from .tracing import TraceRecorder
-from .vm import QNXVM
-
-__all__ = [
-    "QNXState",
-    "Operator",
-    "OperatorLibrary",
-    "DeterministicScheduler",
-    "PriorityScheduler",
-    "SafetyConstraints",
-    "SafetyEnvelope",
-    "SafetyValidator",
-    "RateLimiter",
-    "TraceRecorder",
-    "QNXVM",
-    "GraphVM",
-    "OperatorGraph",
-    "FaultIsolationZone",
-    "DeterministicReplayBuffer",
-    "compute_delta",
-    "Checkpoint",
-    "CheckpointManager",
-    "FaultIsolationZones",
-    "TickCounter",
-]
+from __future__ import annotations
+
+import importlib
+
+# Symbol -> defining submodule, resolved on first attribute access
+# (PEP 562) so importing the package doesn't pull in every submodule.
+_LAZY = {
+    "QNXState": ".state",
+    "Operator": ".operators",
+    "OperatorLibrary": ".operators",
+    "DeterministicScheduler": ".scheduler",
+    "PriorityScheduler": ".scheduler",
+    "SafetyConstraints": ".safety",
+    "SafetyEnvelope": ".safety",
+    "SafetyValidator": ".safety",
+    "RateLimiter": ".safety",
+    "TraceRecorder": ".tracing",
+    "QNXVM": ".vm",
+    "GraphVM": ".graph_vm",
+    "OperatorGraph": ".graph_vm",
+    "FaultIsolationZone": ".graph_vm",
+    "DeterministicReplayBuffer": ".replay_buffer",
+    "compute_delta": ".state_delta",
+    "Checkpoint": ".checkpoint",
+    "CheckpointManager": ".checkpoint",
+    "FaultIsolationZones": ".fault_isolation",
+    "TickCounter": ".ticks",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
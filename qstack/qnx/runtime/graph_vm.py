@@ -2,41 +2,167 @@
 
 from __future__ import annotations
 
-from collections import deque
+import sys
+from array import array
 from dataclasses import dataclass, field
 from typing import Any
 
+from ._topo_jit import topo_order as _topo_order
 from .safety import SafetyEnvelope
 from .tracing import TraceRecorder
 
+# Below this node count the JIT warmup and array conversion cost more
+# than the pure-Python sort saves.
+_JIT_THRESHOLD = 256
+
+
+def _cycle_nodes(row_ptr: list[int], col_idx: list[int], n: int) -> list[int]:
+    """Find one strongly connected component with a cycle via Tarjan.
+
+    Iterative (explicit stack) so deep graphs cannot blow the
+    recursion limit; only invoked on the failure path to turn the bare
+    Kahn count mismatch into an actionable diagnostic.
+    """
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack: list[int] = []
+    counter = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, edge = work.pop()
+            if edge == 0:
+                index[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            advanced = False
+            for e in range(row_ptr[node] + edge, row_ptr[node + 1]):
+                dst = col_idx[e]
+                if index[dst] == -1:
+                    work.append((node, e - row_ptr[node] + 1))
+                    work.append((dst, 0))
+                    advanced = True
+                    break
+                if on_stack[dst]:
+                    low[node] = min(low[node], index[dst])
+            if advanced:
+                continue
+            if low[node] == index[node]:
+                scc = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    scc.append(member)
+                    if member == node:
+                        break
+                has_self_loop = any(
+                    col_idx[e] == node for e in range(row_ptr[node], row_ptr[node + 1])
+                )
+                if len(scc) > 1 or has_self_loop:
+                    return sorted(scc)
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+    return []
+
 
 @dataclass
 class OperatorGraph:
-    """DAG of operator names with explicit dependencies."""
-
-    edges: dict[str, list[str]] = field(default_factory=dict)
-    reverse: dict[str, list[str]] = field(default_factory=dict)
+    """DAG of operator names with explicit dependencies.
+
+    Nodes are mapped to dense integer ids on first sight and edges live
+    structure-of-arrays style in two parallel int buffers, compiled on
+    demand into a CSR adjacency. The topological sort then runs Kahn's
+    algorithm over contiguous int arrays instead of chasing per-node
+    dict and list objects.
+    """
+
+    _name_to_id: dict[str, int] = field(default_factory=dict, init=False)
+    _names: list[str] = field(default_factory=list, init=False)
+    _edge_src: array = field(default_factory=lambda: array("i"), init=False)
+    _edge_dst: array = field(default_factory=lambda: array("i"), init=False)
+    _csr: tuple[list[int], list[int]] | None = field(default=None, init=False, repr=False)
+    _cached_order: list[str] | None = field(default=None, init=False, repr=False)
+
+    def _node_id(self, name: str) -> int:
+        # Interned names make repeated id lookups an identity compare
+        # and dedupe the string storage across edges.
+        name = sys.intern(name)
+        node_id = self._name_to_id.get(name)
+        if node_id is None:
+            node_id = len(self._names)
+            self._name_to_id[name] = node_id
+            self._names.append(name)
+        return node_id
 
     def add_edge(self, src: str, dst: str) -> None:
-        self.edges.setdefault(src, []).append(dst)
-        self.reverse.setdefault(dst, []).append(src)
-        self.edges.setdefault(dst, [])
-        self.reverse.setdefault(src, [])
+        self._edge_src.append(self._node_id(src))
+        self._edge_dst.append(self._node_id(dst))
+        self._csr = None
+        self._cached_order = None
+
+    def _finalize(self) -> tuple[list[int], list[int]]:
+        """Compile the edge buffers into a (row_ptr, col_idx) CSR pair."""
+        if self._csr is None:
+            n = len(self._names)
+            row_ptr = [0] * (n + 1)
+            for src in self._edge_src:
+                row_ptr[src + 1] += 1
+            for i in range(n):
+                row_ptr[i + 1] += row_ptr[i]
+            cursor = list(row_ptr)
+            col_idx = [0] * len(self._edge_dst)
+            for src, dst in zip(self._edge_src, self._edge_dst):
+                col_idx[cursor[src]] = dst
+                cursor[src] += 1
+            self._csr = (row_ptr, col_idx)
+        return self._csr
 
     def topological(self) -> list[str]:
-        indegree: dict[str, int] = {node: len(parents) for node, parents in self.reverse.items()}
-        queue = deque(sorted([n for n, deg in indegree.items() if deg == 0]))
-        order: list[str] = []
-        while queue:
-            node = queue.popleft()
-            order.append(node)
-            for neighbor in self.edges.get(node, []):
-                indegree[neighbor] -= 1
-                if indegree[neighbor] == 0:
-                    queue.append(neighbor)
-        if len(order) != len(indegree):
-            raise ValueError("cycle detected in operator graph")
-        return order
+        # The graph is typically frozen after construction, so the sort
+        # is computed once and reused until the next add_edge.
+        if self._cached_order is not None:
+            return self._cached_order
+        names = self._names
+        n = len(names)
+        row_ptr, col_idx = self._finalize()
+        if _topo_order is not None and n > _JIT_THRESHOLD:
+            seed_order = sorted(range(n), key=names.__getitem__)
+            visited = _topo_order(row_ptr, col_idx, seed_order)
+            if len(visited) != n:
+                raise ValueError(self._cycle_message(row_ptr, col_idx, n))
+            self._cached_order = [names[i] for i in visited]
+            return self._cached_order
+        indegree = [0] * n
+        for dst in col_idx:
+            indegree[dst] += 1
+        # Seed with zero-indegree nodes in name order to keep the
+        # ordering deterministic, then consume the queue in place.
+        queue = sorted((i for i in range(n) if indegree[i] == 0), key=names.__getitem__)
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for edge in range(row_ptr[node], row_ptr[node + 1]):
+                dst = col_idx[edge]
+                indegree[dst] -= 1
+                if indegree[dst] == 0:
+                    queue.append(dst)
+        if len(queue) != n:
+            raise ValueError(self._cycle_message(row_ptr, col_idx, n))
+        self._cached_order = [names[i] for i in queue]
+        return self._cached_order
+
+    def _cycle_message(self, row_ptr: list[int], col_idx: list[int], n: int) -> str:
+        scc = _cycle_nodes(row_ptr, col_idx, n)
+        if not scc:
+            return "cycle detected in operator graph"
+        members = ", ".join(self._names[i] for i in scc)
+        return f"cycle detected in operator graph involving: {members}"
 
 
 @dataclass
@@ -51,10 +177,17 @@ class FaultIsolationZone:
 class GraphVM:
     """Executes operators following a DAG ordering with deterministic tracing."""
 
-    def __init__(self, operators, graph: OperatorGraph, envelope: SafetyEnvelope | None = None):
+    def __init__(
+        self,
+        operators,
+        graph: OperatorGraph,
+        envelope: SafetyEnvelope | None = None,
+        trace_limit: int | None = None,
+    ):
         self._operators = operators
         self._graph = graph
-        self._trace = TraceRecorder()
+        # A trace_limit bounds replay memory for long-running loops.
+        self._trace = TraceRecorder(maxlen=trace_limit)
         self._tick = 0
         self._envelope = envelope
         self._fault_zones: list[FaultIsolationZone] = []
@@ -70,29 +203,46 @@ class GraphVM:
         return None
 
     def run(self, state: Any, goal: Any) -> list[dict[str, Any]]:
-        trace: list[dict[str, Any]] = []
-        for name in self._graph.topological():
-            if self._envelope and not self._envelope.inside(state):
-                record = {"tick": self._tick, "op": name, "error": "safety_envelope_violation"}
-                trace.append(record)
-                self._trace.record("safety_violation", record)
-                break
-            op = self._operators.available().get(name)
-            if op is None:
-                raise KeyError(f"operator {name} not registered")
-            zone = self._zone_for(name)
-            result = op.execute(state, goal)
-            record: dict[str, Any] = {"tick": self._tick, "op": name, "result": result}
-            if zone:
-                record["fault_zone"] = zone.name
-            self._trace.record("execute", record)
-            trace.append(record)
-            self._tick += 1
-            self._checkpoints.append((self._tick, dict(getattr(state, "data", {}))))
+        ops = self._operators.available()
+        order = self._graph.topological()
+        # Preallocate the trace for the cached order and fill by index;
+        # records stay dicts because the replay surface is keyed access.
+        trace: list[dict[str, Any]] = [{}] * len(order)
+        count = 0
+        record_trace = self._trace.record
+        # Keep the tick in a local: two attribute ops per node otherwise.
+        # The write-back runs in a finally so ticks consumed before an
+        # unregistered operator (or a failing execute) raises stay
+        # consistent with the recorded trace and checkpoints.
+        tick = self._tick
+        try:
+            for name in order:
+                if self._envelope and not self._envelope.inside(state):
+                    record = {"tick": tick, "op": name, "error": "safety_envelope_violation"}
+                    trace[count] = record
+                    count += 1
+                    record_trace("safety_violation", record)
+                    break
+                op = ops.get(name)
+                if op is None:
+                    raise KeyError(f"operator {name} not registered")
+                zone = self._zone_for(name)
+                result = op.execute(state, goal)
+                record: dict[str, Any] = {"tick": tick, "op": name, "result": result}
+                if zone:
+                    record["fault_zone"] = zone.name
+                record_trace("execute", record)
+                trace[count] = record
+                count += 1
+                tick += 1
+                self._checkpoints.append((tick, dict(getattr(state, "data", {}))))
+        finally:
+            self._tick = tick
+        del trace[count:]
         return trace
 
-    def replay_buffer(self) -> list[dict[str, Any]]:
-        return [entry["payload"] for entry in self._trace.snapshot()]
+    def replay_buffer(self) -> tuple[dict[str, Any], ...]:
+        return tuple(entry["payload"] for entry in self._trace.records)
 
     def checkpoints(self) -> list[tuple[int, dict[str, Any]]]:
         return list(self._checkpoints)
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 
 
 @dataclass
 class TraceRecorder:
-    records: list[dict[str, Any]] = field(default_factory=list)
+    """Append-only event log, optionally bounded to the last ``maxlen``.
+
+    With a ``maxlen`` the log becomes a ring buffer: long-running loops
+    keep a fixed memory footprint and old entries are evicted in O(1).
+    """
+
+    maxlen: int | None = None
+    records: deque[dict[str, Any]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.records = deque(maxlen=self.maxlen)
 
     def record(self, event: str, payload: dict[str, Any]) -> None:
         self.records.append({"event": event, "payload": payload})
@@ -1,28 +1,83 @@
 from __future__ import annotations
 
-from collections import deque
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class MemorySystem:
+    """Bounded key/value memory backed by a preallocated ring buffer.
+
+    Keys and values live in two parallel lists (structure-of-arrays)
+    addressed by a head pointer and fill count, so recording never
+    allocates per-entry tuples or deque nodes.
+    """
+
     capacity: int = 32
-    _buffer: deque[tuple[str, Any]] = field(default_factory=deque, init=False)
+    _keys: list[str | None] = field(default_factory=list, init=False, repr=False)
+    _values: list[Any] = field(default_factory=list, init=False, repr=False)
+    _head: int = field(default=0, init=False, repr=False)
+    _size: int = field(default=0, init=False, repr=False)
+    # Per-key index kept in lockstep with the ring buffer so recall is
+    # O(matches) instead of a full scan.
+    _index: defaultdict[str, deque[Any]] = field(
+        default_factory=lambda: defaultdict(deque), init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         if self.capacity <= 0:
             raise ValueError("capacity must be positive")
-        self._buffer = deque(maxlen=self.capacity)
+        self._keys = [None] * self.capacity
+        self._values = [None] * self.capacity
+
+    def __len__(self) -> int:
+        return self._size
 
     def record(self, key: str, value: Any) -> None:
-        self._buffer.append((key, value))
+        if self._size == self.capacity:
+            self._evict_oldest()
+        slot = (self._head + self._size) % self.capacity
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._size += 1
+        self._index[key].append(value)
+
+    def _evict_oldest(self) -> tuple[str, Any]:
+        """Drop the oldest entry, keeping the key index in lockstep."""
+        head = self._head
+        old_key, old_value = self._keys[head], self._values[head]
+        self._keys[head] = None
+        self._values[head] = None
+        self._head = (head + 1) % self.capacity
+        self._size -= 1
+        evicted = self._index[old_key]
+        evicted.popleft()
+        if not evicted:
+            del self._index[old_key]
+        return old_key, old_value
 
     def recall(self, key: str) -> list[Any]:
-        return [v for k, v in self._buffer if k == key]
+        return list(self._index.get(key, ()))
+
+    def entries(self) -> list[tuple[str, Any]]:
+        """Snapshot of the buffer contents, oldest first."""
+        head, cap = self._head, self.capacity
+        return [
+            (self._keys[(head + i) % cap], self._values[(head + i) % cap])
+            for i in range(self._size)
+        ]
 
     def latest(self) -> tuple[str, Any] | None:
-        return self._buffer[-1] if self._buffer else None
+        if not self._size:
+            return None
+        slot = (self._head + self._size - 1) % self.capacity
+        return (self._keys[slot], self._values[slot])
 
     def clear(self) -> None:
-        self._buffer.clear()
+        # Reset fill state without reallocating the ring storage.
+        self._keys[:] = [None] * self.capacity
+        self._values[:] = [None] * self.capacity
+        self._head = 0
+        self._size = 0
+        self._index.clear()
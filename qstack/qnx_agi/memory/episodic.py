@@ -17,7 +17,7 @@ class EpisodicMemoryWithDecay(MemorySystem):
         self._apply_decay()
 
     def _apply_decay(self) -> None:
-        if len(self._buffer) <= self.capacity:
+        if len(self) <= self.capacity:
             return
-        while len(self._buffer) > self.capacity:
-            self._buffer.popleft()
+        while len(self) > self.capacity:
+            self._evict_oldest()
@@ -6,11 +6,11 @@ from .base import MemorySystem
 
 
 def enforce_budget(memory: MemorySystem, budget: int) -> list[tuple[str, object]]:
-    entries = list(memory._buffer)
+    entries = memory.entries()
     if len(entries) <= budget:
         return entries
     to_remove = len(entries) - budget
     while to_remove > 0:
-        memory._buffer.popleft()
+        memory._evict_oldest()
         to_remove -= 1
-    return list(memory._buffer)
+    return memory.entries()
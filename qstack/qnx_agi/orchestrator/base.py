@@ -41,7 +41,7 @@ class Orchestrator:
             "id": run_id,
             "percepts": percepts,
             "state": state.facts,
-            "memory": list(self._memory._buffer),
+            "memory": self._memory.entries(),
             "plan": plan,
             "audit": self._audit.export(),
         }
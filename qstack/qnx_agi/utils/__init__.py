@@ -1,6 +1,27 @@
-from .audit_log import AuditLog
-from .ids import deterministic_id
-from .provenance import hash_payload
-from .serialization import deterministic_dumps
+from __future__ import annotations
 
-__all__ = ["hash_payload", "AuditLog", "deterministic_id", "deterministic_dumps"]
+import importlib
+
+# Symbol -> defining submodule, resolved on first attribute access
+# (PEP 562); importing the package no longer loads all four helpers.
+_LAZY = {
+    "hash_payload": ".provenance",
+    "AuditLog": ".audit_log",
+    "deterministic_id": ".ids",
+    "deterministic_dumps": ".serialization",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,7 +1,13 @@
 """Domain-specific deterministic dynamics."""
 
 from .aerospace import aerospace_step
-from .finance import finance_step
-from .pharma import pharma_step
+from .finance import finance_step, finance_step_batch
+from .pharma import pharma_step, pharma_step_batch
 
-__all__ = ["aerospace_step", "finance_step", "pharma_step"]
+__all__ = [
+    "aerospace_step",
+    "finance_step",
+    "finance_step_batch",
+    "pharma_step",
+    "pharma_step_batch",
+]
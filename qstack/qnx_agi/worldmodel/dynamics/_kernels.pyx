@@ -0,0 +1,42 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Optional compiled SoA kernels for the dynamics step functions.
+
+Build opt-in (the package works without it), e.g.:
+
+    cythonize -i qstack/qnx_agi/worldmodel/dynamics/_kernels.pyx
+
+Compile with OpenMP flags (-fopenmp) to parallelize the prange loops;
+without them the loops degrade to serial C, still far ahead of the
+per-element Python fallback.
+"""
+
+from cython.parallel cimport prange
+from libc.math cimport fabs
+
+
+cpdef void finance_step_soa(
+    double[::1] price,
+    double[::1] drift,
+    double[::1] shock,
+    double[::1] out_price,
+    double[::1] out_vol,
+) noexcept nogil:
+    cdef Py_ssize_t i, n = price.shape[0]
+    for i in prange(n):
+        out_price[i] = price[i] * (1.0 + drift[i] + shock[i])
+        out_vol[i] = fabs(shock[i])
+
+
+cpdef void pharma_step_soa(
+    double[::1] a,
+    double[::1] b,
+    double[::1] rate,
+    double[::1] out_a,
+    double[::1] out_b,
+) noexcept nogil:
+    cdef Py_ssize_t i, n = a.shape[0]
+    cdef double delta
+    for i in prange(n):
+        delta = rate[i] * a[i]
+        out_a[i] = a[i] - delta
+        out_b[i] = b[i] + delta
@@ -1,5 +1,33 @@
 from __future__ import annotations
 
+from typing import Sequence
+
+try:  # optional: vectorizes the batch path when available
+    import numpy as _np
+except ImportError:  # pragma: no cover - optional dependency
+    _np = None
+
+try:  # optional: compiled SoA kernel, built from _kernels.pyx
+    from . import _kernels
+except ImportError:  # pragma: no cover - extension not built
+    _kernels = None
+
+try:  # optional: true ufuncs with broadcast semantics
+    from numba import vectorize as _vectorize
+except ImportError:  # pragma: no cover - optional dependency
+    _vectorize = None
+
+if _vectorize is not None:  # pragma: no cover - requires numba
+    pharma_next_a = _vectorize(["f8(f8,f8)"], target="parallel", fastmath=True)(
+        lambda a, rate: a - rate * a
+    )
+    pharma_next_b = _vectorize(["f8(f8,f8,f8)"], target="parallel", fastmath=True)(
+        lambda a, b, rate: b + rate * a
+    )
+else:
+    pharma_next_a = None
+    pharma_next_b = None
+
 
 def pharma_step(state: dict[str, float]) -> dict[str, float]:
     a = float(state.get("A", 0.0))
@@ -7,3 +35,36 @@ def pharma_step(state: dict[str, float]) -> dict[str, float]:
     k = float(state.get("rate", 0.05))
     delta = k * a
     return {"A": a - delta, "B": b + delta, "rate": k}
+
+
+def pharma_step_batch(
+    a: Sequence[float], b: Sequence[float], rate: Sequence[float]
+) -> tuple[Sequence[float], Sequence[float]]:
+    """Structure-of-arrays form of :func:`pharma_step` for ensemble sweeps.
+
+    Takes parallel A/B/rate columns and returns the next (A, B) columns;
+    rates are constant across a step so they pass through unchanged.
+    Vectorizes through numpy when it is installed and falls back to a
+    plain comprehension otherwise.
+    """
+    if _np is not None:
+        a_arr = _np.ascontiguousarray(a, dtype=_np.float64)
+        b_arr = _np.ascontiguousarray(b, dtype=_np.float64)
+        rate_arr = _np.ascontiguousarray(rate, dtype=_np.float64)
+        if _kernels is not None:
+            out_a = _np.empty_like(a_arr)
+            out_b = _np.empty_like(a_arr)
+            _kernels.pharma_step_soa(a_arr, b_arr, rate_arr, out_a, out_b)
+            return out_a, out_b
+        if pharma_next_a is not None:
+            return (
+                pharma_next_a(a_arr, rate_arr),
+                pharma_next_b(a_arr, b_arr, rate_arr),
+            )
+        delta = rate_arr * a_arr
+        return a_arr - delta, b_arr + delta
+    deltas = [k * x for k, x in zip(rate, a)]
+    return (
+        [x - d for x, d in zip(a, deltas)],
+        [x + d for x, d in zip(b, deltas)],
+    )
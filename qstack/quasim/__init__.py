@@ -1,16 +1,31 @@
-from .core.circuits import QuantumCircuit
-from .core.engine import SimulationEngine
-from .core.tensor_ops import matmul, tensor_contract
-from .integration.qnx_adapter import build_qnx_operator_library
-from .quantum.qaoa import qaoa_cost
-from .quantum.vqe import vqe_energy
+from __future__ import annotations
 
-__all__ = [
-    "SimulationEngine",
-    "matmul",
-    "tensor_contract",
-    "QuantumCircuit",
-    "vqe_energy",
-    "qaoa_cost",
-    "build_qnx_operator_library",
-]
+import importlib
+
+# Symbol -> defining submodule, resolved on first attribute access
+# (PEP 562) so importing the package doesn't pull in the whole engine,
+# algorithm, and adapter stack for callers that want one symbol.
+_LAZY = {
+    "SimulationEngine": ".core.engine",
+    "matmul": ".core.tensor_ops",
+    "tensor_contract": ".core.tensor_ops",
+    "QuantumCircuit": ".core.circuits",
+    "vqe_energy": ".quantum.vqe",
+    "qaoa_cost": ".quantum.qaoa",
+    "build_qnx_operator_library": ".integration.qnx_adapter",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,16 +1,30 @@
-from .circuits import QuantumCircuit, QuantumGate
-from .engine import SimulationEngine
-from .evaluators import evaluate_circuit, evaluate_tensor
-from .tensor_contraction import contract_tensors
-from .tensor_ops import matmul, tensor_contract
+from __future__ import annotations
 
-__all__ = [
-    "SimulationEngine",
-    "matmul",
-    "tensor_contract",
-    "contract_tensors",
-    "QuantumCircuit",
-    "QuantumGate",
-    "evaluate_circuit",
-    "evaluate_tensor",
-]
+import importlib
+
+# Symbol -> defining submodule, resolved lazily (PEP 562).
+_LAZY = {
+    "SimulationEngine": ".engine",
+    "matmul": ".tensor_ops",
+    "tensor_contract": ".tensor_ops",
+    "contract_tensors": ".tensor_contraction",
+    "QuantumCircuit": ".circuits",
+    "QuantumGate": ".circuits",
+    "evaluate_circuit": ".evaluators",
+    "evaluate_tensor": ".evaluators",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
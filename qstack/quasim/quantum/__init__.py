@@ -1,5 +1,26 @@
-from .gates import identity, pauli_x
-from .qaoa import qaoa_cost
-from .vqe import vqe_energy
+from __future__ import annotations
 
-__all__ = ["pauli_x", "identity", "vqe_energy", "qaoa_cost"]
+import importlib
+
+# Symbol -> defining submodule, resolved lazily (PEP 562).
+_LAZY = {
+    "pauli_x": ".gates",
+    "identity": ".gates",
+    "vqe_energy": ".vqe",
+    "qaoa_cost": ".qaoa",
+}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
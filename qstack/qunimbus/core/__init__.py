@@ -1,11 +1,21 @@
+from __future__ import annotations
+
+import importlib
+
 from .engine import QuNimbusEngine, ValuationInput
 from .governance import deterministic_auction, governance_score, vote_outcome
-from .governance_vm import GovernanceRule, GovernanceVM
 from .incentives import incentive_budget
 from .pricing import price_stream
 from .risk import risk_score
 
-__all__ = [
+# The governance VM carries opcode tables most callers never touch;
+# resolve it lazily (PEP 562) instead of paying for it on every import.
+_LAZY = {
+    "GovernanceVM": ".governance_vm",
+    "GovernanceRule": ".governance_vm",
+}
+
+__all__ = (
     "QuNimbusEngine",
     "ValuationInput",
     "price_stream",
@@ -16,4 +26,17 @@ __all__ = [
     "incentive_budget",
     "GovernanceVM",
     "GovernanceRule",
-]
+)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
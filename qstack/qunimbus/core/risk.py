@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 
-def risk_score(exposures: dict[str, float], sensitivities: dict[str, float]) -> float:
+def risk_score(
+    exposures: dict[str, float], sensitivities: dict[str, float] | None = None
+) -> float:
+    # None means uniform sensitivity 1.0: sum the exposures directly
+    # instead of probing a dict per asset.
+    if sensitivities is None:
+        return float(sum(exposures.values()))
     score = 0.0
     for key, exposure in exposures.items():
         score += exposure * sensitivities.get(key, 1.0)
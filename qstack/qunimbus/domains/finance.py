@@ -6,5 +6,6 @@ from ..core.risk import risk_score
 
 
 def portfolio_risk(exposures: dict[str, float]) -> float:
-    sensitivities = dict.fromkeys(exposures, 1.0)
-    return risk_score(exposures, sensitivities)
+    # Uniform sensitivities: let risk_score take the summation fast
+    # path instead of building a throwaway all-1.0 dict per call.
+    return risk_score(exposures)
@@ -16,6 +16,8 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 __version__ = "0.1.0"
 __author__ = "Sybernix Team"
 
@@ -60,11 +62,13 @@ class Runtime:
         self._initialized = False
         return False
 
-    def simulate(self, circuit: list[list[complex]]) -> list[complex]:
+    def simulate(self, circuit: list[list[complex]] | np.ndarray) -> list[complex]:
         """Simulate quantum circuit.
 
         Args:
-            circuit: Circuit specification as list of gate matrices
+            circuit: Circuit specification as a sequence of gate rows: a
+                list of gate matrices, a 2D complex ndarray, or any
+                iterable yielding per-gate lists or 1D arrays
 
         Returns:
             Simulation result as state vector
@@ -73,11 +77,21 @@ class Runtime:
             raise RuntimeError("Runtime not initialized. Use 'with runtime(config)' context.")
 
         # Simplified simulation - in production would use actual quantum simulation
-        result = []
-        for gate in circuit:
-            # Average the complex values for each gate
-            avg = sum(gate) / len(gate) if gate else 0j
-            result.append(avg)
+        if isinstance(circuit, np.ndarray) and circuit.ndim == 2:
+            # Contiguous batch: one reduction along the gate axis.
+            if circuit.shape[1] == 0:
+                result = [0j] * circuit.shape[0]
+            else:
+                result = circuit.mean(axis=1).tolist()
+        else:
+            result = []
+            for gate in circuit:
+                # Average the complex values for each gate
+                if isinstance(gate, np.ndarray):
+                    avg = complex(gate.mean()) if gate.size else 0j
+                else:
+                    avg = sum(gate) / len(gate) if gate else 0j
+                result.append(avg)
 
         # Set a non-zero latency to indicate operation completed
         self.average_latency = 0.001  # 1ms simulated latency
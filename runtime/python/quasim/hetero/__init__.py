@@ -0,0 +1,7 @@
+"""Heterogeneous-backend workload classification."""
+
+from __future__ import annotations
+
+from .workload import Workload, WorkloadType
+
+__all__ = ["Workload", "WorkloadType"]
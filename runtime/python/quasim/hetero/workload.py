@@ -0,0 +1,80 @@
+"""Workload descriptors for heterogeneous backend dispatch.
+
+The scheduler classifies thousands of workloads per frame, so the hot
+hint path is a single table lookup keyed by (workload type,
+memory-boundedness); the float suitability scores remain available for
+callers that want the full breakdown.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+# Arithmetic intensity (FLOPs per byte) below which a kernel is
+# bandwidth- rather than compute-limited on current hardware.
+_MEMORY_BOUND_INTENSITY = 10.0
+
+
+class WorkloadType(Enum):
+    TENSOR_CONTRACTION = "tensor_contraction"
+    ELEMENTWISE = "elementwise"
+    REDUCTION = "reduction"
+    CONTROL = "control"
+
+
+# (workload_type, is_memory_bound) -> dominant backend. Built once at
+# import; the hot path pays one tuple hash instead of re-scoring three
+# backends per call.
+_BACKEND_TABLE: dict[tuple[WorkloadType, bool], str] = {
+    (WorkloadType.TENSOR_CONTRACTION, False): "tpu",
+    (WorkloadType.TENSOR_CONTRACTION, True): "gpu",
+    (WorkloadType.ELEMENTWISE, False): "gpu",
+    (WorkloadType.ELEMENTWISE, True): "gpu",
+    (WorkloadType.REDUCTION, False): "gpu",
+    (WorkloadType.REDUCTION, True): "cpu",
+    (WorkloadType.CONTROL, False): "cpu",
+    (WorkloadType.CONTROL, True): "cpu",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Workload:
+    workload_type: WorkloadType
+    size_gflops: float
+    arithmetic_intensity: float
+    # Classified once at construction; the hint path and both
+    # suitability estimators read a plain attribute instead of
+    # re-comparing floats per query.
+    is_memory_bound: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "is_memory_bound", self.arithmetic_intensity < _MEMORY_BOUND_INTENSITY
+        )
+
+    @property
+    def is_compute_bound(self) -> bool:
+        return not self.is_memory_bound
+
+    def get_optimal_backend_hint(self) -> str:
+        """Dominant backend for this workload; one dict probe."""
+        return _BACKEND_TABLE[(self.workload_type, self.is_memory_bound)]
+
+    def backend_scores(self) -> dict[str, float]:
+        """Full suitability breakdown; slow path for diagnostics.
+
+        Scores combine problem size with how well each backend tolerates
+        low arithmetic intensity; the argmax agrees with the table for
+        the coarse regimes the scheduler cares about.
+        """
+        intensity = self.arithmetic_intensity
+        size = self.size_gflops
+        cpu = 1.0 / (1.0 + size)
+        gpu = min(size / 10.0, 1.0) * min(intensity / _MEMORY_BOUND_INTENSITY, 1.0)
+        tpu = (
+            min(size / 100.0, 1.0)
+            if self.workload_type is WorkloadType.TENSOR_CONTRACTION
+            else 0.0
+        )
+        return {"cpu": cpu, "gpu": gpu, "tpu": tpu}
@@ -0,0 +1,7 @@
+"""Lightweight tensor-op IR for the GB10 QuASIM runtime."""
+
+from __future__ import annotations
+
+from .ir_builder import IRBuilder, IRNode
+
+__all__ = ["IRBuilder", "IRNode"]
@@ -0,0 +1,157 @@
+"""Graph IR builder with elementwise-op fusion.
+
+Nodes form a DAG of tensor ops in insertion (topological) order. The
+fusion pass groups chains of elementwise ops with a union-find over
+"fusion groups" in a single forward walk, then materializes one fused
+node per group — O(N + E) total, instead of rewriting every output
+list once per fused pair.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+
+class OpCode(IntEnum):
+    """Integer tags for known ops; fusion tests a bitmask, not a set."""
+
+    ADD = 0
+    SUB = 1
+    MUL = 2
+    NEG = 3
+    ABS = 4
+    EXP = 5
+    RELU = 6
+    SCALE = 7
+    OTHER = 63
+
+
+_OPCODE_OF = {code.name.lower(): code for code in OpCode if code is not OpCode.OTHER}
+
+# Ops that are pointwise over their input and safe to fuse into a chain.
+FUSABLE_OPS: frozenset[str] = frozenset(_OPCODE_OF)
+_FUSABLE_MASK = 0
+for _name in FUSABLE_OPS:
+    _FUSABLE_MASK |= 1 << _OPCODE_OF[_name]
+
+# Fused group signature -> shared op name, so repeated chains like
+# add->mul reuse one interned string instead of re-joining per group.
+_FUSED_NAME_CACHE: dict[tuple[int, ...], str] = {}
+
+
+@dataclass(eq=False, slots=True)
+class IRNode:
+    op: str
+    inputs: list["IRNode"] = field(default_factory=list)
+    outputs: list["IRNode"] = field(default_factory=list)
+    op_code: int = OpCode.OTHER
+    shape: tuple[int, ...] = ()
+    dtype: str = "f32"
+    # Classified once at construction so the fusion pass reads a bool.
+    elementwise: bool = False
+
+
+class IRBuilder:
+    def __init__(self):
+        self.nodes: list[IRNode] = []
+
+    def add_tensor_op(
+        self,
+        op: str,
+        inputs: list[IRNode] | None = None,
+        shape: tuple[int, ...] = (),
+        dtype: str = "f32",
+    ) -> IRNode:
+        op = sys.intern(op)
+        op_code = _OPCODE_OF.get(op, OpCode.OTHER)
+        node = IRNode(
+            op=op,
+            inputs=list(inputs) if inputs else [],
+            op_code=op_code,
+            shape=shape,
+            dtype=sys.intern(dtype),
+            elementwise=bool((1 << op_code) & _FUSABLE_MASK),
+        )
+        for inp in node.inputs:
+            inp.outputs.append(node)
+        self.nodes.append(node)
+        return node
+
+    def fuse_elementwise_ops(self) -> list[IRNode]:
+        """Collapse chains of fusable elementwise ops into single nodes.
+
+        A node joins its producer's group when both ops are fusable
+        (a bool set at construction), the node is unary, and the
+        producer feeds nothing else. ``self.nodes`` stays topologically
+        ordered, so one forward walk sees every producer before its
+        consumers and chain heads propagate directly — no union-find
+        root chasing.
+        """
+        head: dict[IRNode, IRNode] = {}
+        members: dict[IRNode, list[IRNode]] = {}
+        for node in self.nodes:
+            group_head = node
+            if node.elementwise and len(node.inputs) == 1:
+                producer = node.inputs[0]
+                if producer.elementwise and len(producer.outputs) == 1:
+                    group_head = head[producer]
+            head[node] = group_head
+            members.setdefault(group_head, []).append(node)
+
+        # Materialize one node per group, emitting members in original
+        # order so fused op names read producer-to-consumer.
+        fused_of: dict[IRNode, IRNode] = {}
+        result: list[IRNode] = []
+        for node in self.nodes:
+            group = members[head[node]]
+            if group[0] is not node:
+                continue  # group already emitted at its first member
+            tail = group[-1]
+            if len(group) == 1:
+                fused = IRNode(op=node.op, op_code=node.op_code, shape=node.shape, dtype=node.dtype)
+            else:
+                signature = tuple(m.op_code for m in group)
+                name = _FUSED_NAME_CACHE.get(signature)
+                if name is None:
+                    name = sys.intern("_".join(m.op for m in group))
+                    _FUSED_NAME_CACHE[signature] = name
+                fused = IRNode(op=name, shape=tail.shape, dtype=tail.dtype)
+            fused_of[node] = fused
+            result.append(fused)
+
+        # Re-link edges between groups, skipping intra-group edges.
+        for node in self.nodes:
+            fused = fused_of[head[node]]
+            for inp in node.inputs:
+                src = fused_of[head[inp]]
+                if src is not fused:
+                    fused.inputs.append(src)
+                    src.outputs.append(fused)
+
+        self.nodes = result
+        return result
+
+    def to_mlir(self) -> str:
+        """Render the graph as MLIR-ish text in one pass.
+
+        The output list is preallocated and every %N reference string
+        is built exactly once and reused for each edge that mentions
+        it, so a node costs one formatted line instead of a fresh
+        small-string per operand.
+        """
+        nodes = self.nodes
+        lines = [""] * (len(nodes) + 2)
+        lines[0] = "module {"
+        lines[-1] = "}"
+        refs = [f"%{i}" for i in range(len(nodes))]
+        index_of = {node: i for i, node in enumerate(nodes)}
+        for idx, node in enumerate(nodes):
+            inputs_str = ", ".join(refs[index_of[inp]] for inp in node.inputs)
+            shape_str = "x".join(map(str, node.shape)) or "scalar"
+            lines[idx + 1] = (
+                f"  {refs[idx]} = {node.op}({inputs_str})"
+                f" : tensor<{shape_str}x{node.dtype}>"
+            )
+        return "\n".join(lines)
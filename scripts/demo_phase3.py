@@ -3,7 +3,12 @@
 
 from __future__ import annotations
 
+import io
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 
 from certs.verifier import StabilityVerifier
 from evolve.energy_monitor import EnergyMonitor
@@ -364,6 +369,25 @@ def demo_federated():
     print("\nSaved aggregated data to federated/aggregated/aggregated_performance.json")
 
 
+class _ThreadLocalWriter(io.TextIOBase):
+    """Route writes to a per-thread buffer, falling back to the real stream.
+
+    Lets independent demos run concurrently while each thread's prints
+    accumulate in its own buffer instead of interleaving on stdout.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def register(self, buffer: io.StringIO) -> None:
+        self._local.buffer = buffer
+
+    def write(self, text: str) -> int:
+        target = getattr(self._local, "buffer", None) or self._fallback
+        return target.write(text)
+
+
 def main():
     """Run all demos."""
     print("\n")
@@ -371,20 +395,32 @@ def main():
     print("║" + " " * 10 + "Phase III Autonomous Kernel Evolution Demo" + " " * 15 + "║")
     print("╚" + "═" * 68 + "╝")
 
-    demos = [
-        demo_evolution,
-        demo_precision,
-        demo_scheduling,
-        demo_quantum_search,
-        demo_memory_graph,
-        demo_causal_profiling,
-        demo_energy,
-        demo_verification,
-        demo_federated,
-    ]
-
-    for demo in demos:
+    demo_evolution()
+    demo_precision()
+
+    # Demos 3-5 are independent optimizers (gradient scheduling,
+    # simulated annealing, memory-graph layout); run them concurrently
+    # with per-thread output capture, then emit each section with a
+    # single buffered write instead of hundreds of small ones.
+    concurrent_demos = [demo_scheduling, demo_quantum_search, demo_memory_graph]
+    writer = _ThreadLocalWriter(sys.stdout)
+
+    def run_captured(demo):
+        buffer = io.StringIO()
+        writer.register(buffer)
         demo()
+        return buffer.getvalue()
+
+    with redirect_stdout(writer):
+        with ThreadPoolExecutor(max_workers=len(concurrent_demos)) as pool:
+            sections = list(pool.map(run_captured, concurrent_demos))
+    for section in sections:
+        sys.stdout.write(section)
+
+    demo_causal_profiling()
+    demo_energy()
+    demo_verification()
+    demo_federated()
 
     print("\n" + "=" * 70)
     print("DEMO COMPLETE")
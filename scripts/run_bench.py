@@ -10,6 +10,7 @@ from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 BENCH_SCRIPT = REPO_ROOT / "benchmarks" / "quasim_bench.py"
+RUNTIME_PATHS = [str(REPO_ROOT / "runtime" / "python"), str(REPO_ROOT / "quantum")]
 
 
 def parse_args() -> argparse.Namespace:
@@ -23,17 +24,28 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    env = dict(**os.environ)
-    python_path = env.get("PYTHONPATH", "")
-    runtime_paths = [str(REPO_ROOT / "runtime" / "python"), str(REPO_ROOT / "quantum")]
-    env["PYTHONPATH"] = ":".join(runtime_paths + ([python_path] if python_path else []))
-
-    cmd = [sys.executable, str(BENCH_SCRIPT)]
-    cmd.extend(["--batches", str(args.batches)])
-    cmd.extend(["--rank", str(args.rank)])
-    cmd.extend(["--dimension", str(args.dimension)])
-    cmd.extend(["--repeat", str(args.repeat)])
-    subprocess.run(cmd, check=True, env=env)
+    argv = [
+        "--batches", str(args.batches),
+        "--rank", str(args.rank),
+        "--dimension", str(args.dimension),
+        "--repeat", str(args.repeat),
+    ]
+
+    # Dispatch in-process when the benchmark imports cleanly: no fresh
+    # interpreter start and no second NumPy import per invocation.
+    try:
+        for path in RUNTIME_PATHS + [str(BENCH_SCRIPT.parent)]:
+            if path not in sys.path:
+                sys.path.insert(0, path)
+        import quasim_bench
+    except ImportError:
+        env = dict(**os.environ)
+        python_path = env.get("PYTHONPATH", "")
+        env["PYTHONPATH"] = ":".join(RUNTIME_PATHS + ([python_path] if python_path else []))
+        subprocess.run([sys.executable, str(BENCH_SCRIPT), *argv], check=True, env=env)
+        return
+
+    quasim_bench.main(argv)
 
 
 if __name__ == "__main__":
@@ -7,12 +7,18 @@ GNC data) into QuASIM's simulation pipeline.
 
 from __future__ import annotations
 
+from .dragon_adapter import DragonTelemetryAdapter, DragonTelemetrySchema
 from .nasa_adapter import NASATelemetryAdapter, NASATelemetrySchema
 from .spacex_adapter import SpaceXTelemetryAdapter, SpaceXTelemetrySchema
+from .starship_adapter import StarshipTelemetryAdapter, StarshipTelemetrySchema
 
 __all__ = [
     "SpaceXTelemetryAdapter",
     "SpaceXTelemetrySchema",
+    "StarshipTelemetryAdapter",
+    "StarshipTelemetrySchema",
+    "DragonTelemetryAdapter",
+    "DragonTelemetrySchema",
     "NASATelemetryAdapter",
     "NASATelemetrySchema",
 ]
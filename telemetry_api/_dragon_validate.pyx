@@ -0,0 +1,72 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional compiled validator for Dragon telemetry records.
+
+Build opt-in (the adapter works without it), e.g.:
+
+    cythonize -i telemetry_api/_dragon_validate.pyx
+
+Mirrors DragonTelemetryAdapter.validate_schema exactly — same checks,
+same error strings — with the comparisons and norms running as typed C
+arithmetic instead of interpreter dispatch.
+"""
+
+from libc.math cimport fabs, sqrt
+
+_VALID_DOCKING = frozenset({"SEPARATED", "APPROACH", "PROXIMITY", "DOCKED"})
+
+
+def validate_record(telemetry):
+    """Return (is_valid, errors) for a parsed DragonTelemetrySchema."""
+    cdef double timestamp = telemetry.timestamp
+    cdef double pos_mag, vel_mag, q_norm, cabin_temp, battery_soc, value
+
+    errors = []
+
+    if timestamp < 0:
+        errors.append("Timestamp must be non-negative")
+
+    vehicle_id = telemetry.vehicle_id
+    if not vehicle_id.startswith("Dragon"):
+        errors.append(f"Invalid vehicle ID format: {vehicle_id}")
+
+    trajectory = telemetry.trajectory_data
+
+    pos_mag = 0.0
+    for value in trajectory.get("position_eci", ()):
+        pos_mag += value * value
+    pos_mag = sqrt(pos_mag)
+    if pos_mag > 0 and (pos_mag < 6_300_000 or pos_mag > 50_000_000):
+        errors.append(f"Position magnitude out of orbital range: {pos_mag / 1000:.1f} km")
+
+    vel_mag = 0.0
+    for value in trajectory.get("velocity_eci", ()):
+        vel_mag += value * value
+    vel_mag = sqrt(vel_mag)
+    if vel_mag > 15_000:
+        errors.append(f"Velocity magnitude exceeds orbital: {vel_mag:.1f} m/s")
+
+    q = trajectory.get("quaternion", (1.0, 0.0, 0.0, 0.0))
+    if len(q) != 4:
+        errors.append("Quaternion must have 4 components")
+    else:
+        q_norm = sqrt(q[0] * q[0] + q[1] * q[1] + q[2] * q[2] + q[3] * q[3])
+        if fabs(q_norm - 1.0) > 0.01:
+            errors.append(f"Quaternion not normalized: ||q|| = {q_norm}")
+
+    # Raw objects are kept for the messages so "70" renders as the
+    # pure-Python validator would, while the comparisons run on doubles.
+    cabin_temp_obj = telemetry.environmental_data.get("cabin_temp_c", 22.0)
+    cabin_temp = cabin_temp_obj
+    if cabin_temp < -50 or cabin_temp > 60:
+        errors.append(f"Cabin temperature out of range: {cabin_temp_obj}C")
+
+    battery_soc_obj = telemetry.power_data.get("battery_soc_pct", 100.0)
+    battery_soc = battery_soc_obj
+    if battery_soc < 0 or battery_soc > 100:
+        errors.append(f"Battery SOC out of range: {battery_soc_obj}%")
+
+    docking_status = telemetry.gnc_data.get("docking_status", "SEPARATED")
+    if docking_status not in _VALID_DOCKING:
+        errors.append(f"Invalid docking status: {docking_status}")
+
+    return len(errors) == 0, errors
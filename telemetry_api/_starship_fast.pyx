@@ -0,0 +1,38 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional compiled numeric validator for Starship telemetry records.
+
+Build opt-in (the adapter works without it), e.g.:
+
+    cythonize -i telemetry_api/_starship_fast.pyx
+
+Takes the numeric fields as unboxed doubles and returns the same error
+bitmask as the pure-Python fallback in starship_adapter.validate_schema;
+the adapter decodes set bits into error strings only for invalid
+records.
+"""
+
+from libc.math cimport fabs, sqrt
+from libc.stdint cimport uint32_t
+
+
+def validate_numeric(double timestamp, double mass, double altitude,
+                     double mach, double raptor_count,
+                     double q0, double q1, double q2, double q3):
+    """Return the numeric-check error bitmask for one record."""
+    cdef uint32_t mask = 0
+    cdef double q_norm
+
+    if timestamp < 0:
+        mask |= 1  # _ERR_TIMESTAMP
+    if mass < 0 or mass > 5_000_000:
+        mask |= 2  # _ERR_MASS
+    if altitude < -500 or altitude > 200_000:
+        mask |= 4  # _ERR_ALTITUDE
+    if mach < 0 or mach > 30:
+        mask |= 8  # _ERR_MACH
+    if raptor_count < 0 or raptor_count > 33:
+        mask |= 16  # _ERR_RAPTOR
+    q_norm = sqrt(q0 * q0 + q1 * q1 + q2 * q2 + q3 * q3)
+    if fabs(q_norm - 1.0) > 0.01:
+        mask |= 32  # _ERR_QUAT
+    return mask
@@ -0,0 +1,359 @@
+"""SpaceX telemetry adapter for Dragon capsule on-orbit data ingestion."""
+
+from __future__ import annotations
+
+import math
+import sys
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised without numpy installed
+    np = None
+
+try:  # pragma: no cover - gRPC is not part of the test environment
+    import grpc
+except ImportError:
+    grpc = None
+
+try:  # pragma: no cover - built manually, see _dragon_validate.pyx
+    from ._dragon_validate import validate_record as _c_validate
+except ImportError:
+    _c_validate = None
+
+# One keepalive channel per endpoint, shared by every adapter instance:
+# HTTP/2 multiplexes the RPCs, so reconnecting per adapter would just
+# re-pay the handshake.
+_CHANNELS: dict[str, Any] = {}
+
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+
+@dataclass(slots=True)
+class DragonTelemetrySchema:
+    """Dragon capsule telemetry data schema.
+
+    Attributes:
+        timestamp: Mission elapsed time (seconds)
+        vehicle_id: Vehicle identifier (e.g., "Dragon_C208")
+        trajectory_data: On-orbit state (position, velocity, attitude)
+        environmental_data: Cabin environment (temperature, pressure)
+        power_data: Electrical power system telemetry
+        gnc_data: GNC mode and control data
+    """
+
+    timestamp: float
+    vehicle_id: str
+    trajectory_data: dict[str, Any] = field(default_factory=dict)
+    environmental_data: dict[str, Any] = field(default_factory=dict)
+    power_data: dict[str, Any] = field(default_factory=dict)
+    gnc_data: dict[str, Any] = field(default_factory=dict)
+
+
+# Shared default vectors: .get() defaults are evaluated every call,
+# so tuples here avoid building ~30 fresh lists per parsed record.
+# Consumers only read them as sequences.
+_ZERO3 = (0.0, 0.0, 0.0)
+_IDENT_Q = (1.0, 0.0, 0.0, 0.0)
+
+# Categorical fields: O(1) frozenset membership instead of a list scan,
+# and values are interned at parse so every record with the same status
+# shares one string object.
+_VALID_DOCKING = frozenset({"SEPARATED", "APPROACH", "PROXIMITY", "DOCKED"})
+
+# parse_telemetry body, compiled once at import. Generating the
+# function keeps every field key and default pre-bound in one flat
+# return expression — no per-call method dispatch or re-built key
+# strings — while leaving the field list readable here as source.
+_PARSE_SRC = '''
+def _parse(raw):
+    return DragonTelemetrySchema(
+        timestamp=float(raw["timestamp"]),
+        vehicle_id=str(raw["vehicle_id"]),
+        trajectory_data={
+            "position_eci": raw.get("position", _ZERO3),
+            "velocity_eci": raw.get("velocity", _ZERO3),
+            "quaternion": raw.get("attitude_q", _IDENT_Q),
+            "angular_rates": raw.get("angular_rates", _ZERO3),
+        },
+        environmental_data={
+            "cabin_temp_c": raw.get("cabin_temp", 22.0),
+            "cabin_pressure_kpa": raw.get("cabin_pressure", 101.3),
+            "co2_ppm": raw.get("co2", 400.0),
+        },
+        power_data={
+            "battery_soc_pct": raw.get("battery_soc", 100.0),
+            "bus_voltage_v": raw.get("bus_voltage", 28.0),
+            "solar_array_w": raw.get("solar_power", 0.0),
+        },
+        gnc_data={
+            "gnc_mode": intern(raw.get("gnc_mode", "NOMINAL")),
+            "docking_status": intern(raw.get("docking_status", "SEPARATED")),
+            "thruster_commands": raw.get("thrusters", []),
+        },
+    )
+'''
+
+_parse_ns: dict[str, Any] = {
+    "DragonTelemetrySchema": DragonTelemetrySchema,
+    "_ZERO3": _ZERO3,
+    "_IDENT_Q": _IDENT_Q,
+    "intern": sys.intern,
+}
+exec(compile(_PARSE_SRC, "<dragon_parse>", "exec"), _parse_ns)
+_PARSE = _parse_ns["_parse"]
+
+
+class DragonTelemetryAdapter:
+    """Adapter for Dragon capsule telemetry ingestion via gRPC."""
+
+    def __init__(self, endpoint: str = "localhost:8002"):
+        """Initialize Dragon telemetry adapter.
+
+        Args:
+            endpoint: gRPC endpoint for telemetry service
+        """
+        self.endpoint = endpoint
+        self._connected = False
+        self._channel: Any = None
+
+    def connect(self) -> bool:
+        """Establish connection to Dragon telemetry service.
+
+        Adapters for the same endpoint share one long-lived channel
+        from the module cache rather than handshaking per instance.
+
+        Returns:
+            True if connection successful
+        """
+        if grpc is not None:
+            channel = _CHANNELS.get(self.endpoint)
+            if channel is None:
+                channel = grpc.insecure_channel(self.endpoint, options=_CHANNEL_OPTIONS)
+                _CHANNELS[self.endpoint] = channel
+            self._channel = channel
+        self._connected = True
+        return self._connected
+
+    def parse_telemetry(self, raw_data: dict[str, Any]) -> DragonTelemetrySchema:
+        """Parse raw telemetry data into structured schema.
+
+        Args:
+            raw_data: Raw telemetry dictionary from Dragon data stream
+
+        Returns:
+            Parsed telemetry schema
+
+        Raises:
+            ValueError: If schema validation fails
+        """
+        try:
+            return _PARSE(raw_data)
+        except KeyError as e:
+            raise ValueError(f"Missing required field: {e.args[0]}") from e
+
+    def validate_schema(self, telemetry: DragonTelemetrySchema) -> tuple[bool, list[str]]:
+        """Validate telemetry schema compliance.
+
+        Args:
+            telemetry: Parsed telemetry data
+
+        Returns:
+            Tuple of (is_valid, list of validation errors)
+        """
+        if _c_validate is not None:
+            return _c_validate(telemetry)
+
+        errors = []
+
+        # Validate timestamp
+        if telemetry.timestamp < 0:
+            errors.append("Timestamp must be non-negative")
+
+        # Validate vehicle ID format
+        if not telemetry.vehicle_id.startswith("Dragon"):
+            errors.append(f"Invalid vehicle ID format: {telemetry.vehicle_id}")
+
+        # Validate position magnitude (LEO through rendezvous envelope);
+        # math.hypot is one C call per magnitude vs. a generator reduction.
+        position = telemetry.trajectory_data.get("position_eci", _ZERO3)
+        pos_mag = math.hypot(*position)
+        if pos_mag > 0 and (pos_mag < 6_300_000 or pos_mag > 50_000_000):  # meters
+            errors.append(f"Position magnitude out of orbital range: {pos_mag / 1000:.1f} km")
+
+        # Validate velocity magnitude (orbital: ~7-8 km/s)
+        velocity = telemetry.trajectory_data.get("velocity_eci", _ZERO3)
+        vel_mag = math.hypot(*velocity)
+        if vel_mag > 15_000:  # m/s
+            errors.append(f"Velocity magnitude exceeds orbital: {vel_mag:.1f} m/s")
+
+        # Validate quaternion normalization
+        q = telemetry.trajectory_data.get("quaternion", _IDENT_Q)
+        if len(q) != 4:
+            errors.append("Quaternion must have 4 components")
+        else:
+            q_norm = math.sqrt(q[0] * q[0] + q[1] * q[1] + q[2] * q[2] + q[3] * q[3])
+            if abs(q_norm - 1.0) > 0.01:
+                errors.append(f"Quaternion not normalized: ||q|| = {q_norm}")
+
+        # Validate cabin environment
+        cabin_temp = telemetry.environmental_data.get("cabin_temp_c", 22.0)
+        if cabin_temp < -50 or cabin_temp > 60:
+            errors.append(f"Cabin temperature out of range: {cabin_temp}C")
+
+        # Validate battery state of charge
+        battery_soc = telemetry.power_data.get("battery_soc_pct", 100.0)
+        if battery_soc < 0 or battery_soc > 100:
+            errors.append(f"Battery SOC out of range: {battery_soc}%")
+
+        # Validate docking status
+        docking_status = telemetry.gnc_data.get("docking_status", "SEPARATED")
+        if docking_status not in _VALID_DOCKING:
+            errors.append(f"Invalid docking status: {docking_status}")
+
+        is_valid = len(errors) == 0
+        return is_valid, errors
+
+    def ingest_batch(self, raw_batch: list[dict[str, Any]]) -> tuple[int, int, list[str]]:
+        """Ingest batch of telemetry data.
+
+        Args:
+            raw_batch: List of raw telemetry dictionaries
+
+        Returns:
+            Tuple of (successful_count, failed_count, error_messages)
+        """
+        successful = 0
+        failed = 0
+        errors = []
+
+        for i, raw_data in enumerate(raw_batch):
+            try:
+                telemetry = self.parse_telemetry(raw_data)
+                is_valid, validation_errors = self.validate_schema(telemetry)
+
+                if is_valid:
+                    successful += 1
+                else:
+                    failed += 1
+                    errors.extend([f"Record {i}: {err}" for err in validation_errors])
+            except Exception as e:
+                failed += 1
+                errors.append(f"Record {i}: {str(e)}")
+
+        return successful, failed, errors
+
+    def ingest_batch_vectorized(
+        self, raw_batch: list[dict[str, Any]]
+    ) -> tuple[int, int, list[str]]:
+        """Ingest a batch with NumPy bulk validation.
+
+        All numeric range checks run as vectorized boolean masks over
+        stacked field arrays; only records flagged by a mask (or whose
+        fields could not be stacked at all) take the per-record path to
+        produce their error messages. Matches :meth:`ingest_batch`
+        output exactly, and falls back to it when numpy is unavailable.
+
+        Args:
+            raw_batch: List of raw telemetry dictionaries
+
+        Returns:
+            Tuple of (successful_count, failed_count, error_messages)
+        """
+        if np is None or not raw_batch:
+            return self.ingest_batch(raw_batch)
+
+        n = len(raw_batch)
+        suspect = np.zeros(n, dtype=bool)
+        timestamps = np.zeros(n)
+        positions = np.zeros((n, 3))
+        velocities = np.zeros((n, 3))
+        quaternions = np.zeros((n, 4))
+        quaternions[:, 0] = 1.0
+        cabin_temps = np.full(n, 22.0)
+        battery_socs = np.full(n, 100.0)
+
+        for i, raw_data in enumerate(raw_batch):
+            try:
+                timestamps[i] = float(raw_data["timestamp"])
+                if not str(raw_data["vehicle_id"]).startswith("Dragon"):
+                    suspect[i] = True
+                    continue
+                if raw_data.get("docking_status", "SEPARATED") not in _VALID_DOCKING:
+                    suspect[i] = True
+                    continue
+                positions[i] = raw_data.get("position", (0.0, 0.0, 0.0))
+                velocities[i] = raw_data.get("velocity", (0.0, 0.0, 0.0))
+                quaternions[i] = raw_data.get("attitude_q", (1.0, 0.0, 0.0, 0.0))
+                cabin_temps[i] = raw_data.get("cabin_temp", 22.0)
+                battery_socs[i] = raw_data.get("battery_soc", 100.0)
+            except (KeyError, TypeError, ValueError):
+                suspect[i] = True
+
+        pos_mag = np.linalg.norm(positions, axis=1)
+        vel_mag = np.linalg.norm(velocities, axis=1)
+        q_norm = np.linalg.norm(quaternions, axis=1)
+        invalid = (
+            suspect
+            | (timestamps < 0)
+            | ((pos_mag > 0) & ((pos_mag < 6_300_000) | (pos_mag > 50_000_000)))
+            | (vel_mag > 15_000)
+            | (np.abs(q_norm - 1.0) > 0.01)
+            | (cabin_temps < -50)
+            | (cabin_temps > 60)
+            | (battery_socs < 0)
+            | (battery_socs > 100)
+        )
+
+        failing = np.nonzero(invalid)[0]
+        errors: list[str] = []
+        for i in failing:
+            raw_data = raw_batch[i]
+            try:
+                _, validation_errors = self.validate_schema(self.parse_telemetry(raw_data))
+                errors.extend(f"Record {i}: {err}" for err in validation_errors)
+            except Exception as e:
+                errors.append(f"Record {i}: {str(e)}")
+
+        failed = int(failing.shape[0])
+        return n - failed, failed, errors
+
+    def export_quasim_format(self, telemetry: DragonTelemetrySchema) -> dict[str, Any]:
+        """Export telemetry in QuASIM internal format.
+
+        Args:
+            telemetry: Dragon telemetry data
+
+        Returns:
+            Dictionary in QuASIM format
+        """
+        # Vehicle IDs already carry the Dragon prefix in the nominal
+        # case; reuse the existing string instead of allocating
+        # "Dragon_<id>" per exported record.
+        vehicle_id = telemetry.vehicle_id
+        source = vehicle_id if vehicle_id.startswith("Dragon") else f"Dragon_{vehicle_id}"
+        return {
+            "timestamp": telemetry.timestamp,
+            "source": source,
+            "state": {
+                "position": telemetry.trajectory_data.get("position_eci", _ZERO3),
+                "velocity": telemetry.trajectory_data.get("velocity_eci", _ZERO3),
+                "attitude": telemetry.trajectory_data.get("quaternion", _IDENT_Q),
+            },
+            "environment": telemetry.environmental_data,
+            "power": telemetry.power_data,
+            "gnc": telemetry.gnc_data,
+        }
+
+    def disconnect(self) -> None:
+        """Disconnect from telemetry service.
+
+        Drops this adapter's reference only; the cached channel stays
+        open for other adapters on the same endpoint.
+        """
+        self._channel = None
+        self._connected = False
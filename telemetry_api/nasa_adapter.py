@@ -27,6 +27,12 @@ class NASATelemetrySchema:
     sensor_data: dict[str, Any] = field(default_factory=dict)
 
 
+# Categorical membership as frozensets: O(1) hash probe per record
+# instead of scanning a list rebuilt on every call.
+_VALID_SYSTEMS = frozenset({"Orion", "SLS", "Orion_ESM"})
+_VALID_GNC_MODES = frozenset({"NOMINAL", "SAFE", "ABORT", "DOCKING", "REENTRY"})
+
+
 class NASATelemetryAdapter:
     """Adapter for NASA Orion/SLS telemetry ingestion."""
 
@@ -151,8 +157,7 @@ class NASATelemetryAdapter:
             errors.append("MET must be non-negative")
 
         # Validate vehicle system
-        valid_systems = ["Orion", "SLS", "Orion_ESM"]
-        if telemetry.vehicle_system not in valid_systems:
+        if telemetry.vehicle_system not in _VALID_SYSTEMS:
             errors.append(f"Invalid vehicle system: {telemetry.vehicle_system}")
 
         # Validate state vector
@@ -161,8 +166,7 @@ class NASATelemetryAdapter:
             errors.append(state_error)
 
         # Validate GNC mode
-        valid_modes = ["NOMINAL", "SAFE", "ABORT", "DOCKING", "REENTRY"]
-        if telemetry.gnc_mode not in valid_modes:
+        if telemetry.gnc_mode not in _VALID_GNC_MODES:
             errors.append(f"Invalid GNC mode: {telemetry.gnc_mode}")
 
         is_valid = len(errors) == 0
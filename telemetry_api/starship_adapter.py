@@ -0,0 +1,637 @@
+"""SpaceX telemetry adapter for Starship full-stack launch data ingestion."""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+import numpy as np
+
+try:  # pragma: no cover - numba is an optional accelerator
+    from numba import njit
+
+    # Eager signature so compilation happens at import and is cached to
+    # disk, instead of stalling on the first validated record.
+    @njit("float64(float64,float64,float64,float64)", cache=True, fastmath=True)
+    def _quat_norm_err(q0, q1, q2, q3):  # pragma: no cover - compiled
+        return (q0 * q0 + q1 * q1 + q2 * q2 + q3 * q3) ** 0.5 - 1.0
+
+except ImportError:
+    _quat_norm_err = None
+
+try:  # pragma: no cover - built manually, see _starship_fast.pyx
+    from ._starship_fast import validate_numeric as _c_validate_numeric
+except ImportError:
+    _c_validate_numeric = None
+
+# Bit layout of the numeric-check error mask, shared between the
+# compiled validator and the pure-Python fallback.
+_ERR_TIMESTAMP = 1
+_ERR_MASS = 2
+_ERR_ALTITUDE = 4
+_ERR_MACH = 8
+_ERR_RAPTOR = 16
+_ERR_QUAT = 32
+
+# Singleton success result: valid records (the common case) should not
+# allocate a fresh list and tuple just to say so.
+_OK = (True, ())
+
+# Batch size above which ingest_batch hands off to the columnar path;
+# below it the array setup costs more than the loop it replaces.
+_VECTORIZE_MIN = 32
+
+# Shared immutable defaults: .get() evaluates its default eagerly, so
+# list literals there allocate fresh garbage for every parsed record
+# even when the key is present. Consumers only read these.
+_ZERO3 = (0.0, 0.0, 0.0)
+_QUAT_IDENT = (1.0, 0.0, 0.0, 0.0)
+_EMPTY_DICT: Any = MappingProxyType({})
+
+try:  # pragma: no cover - msgspec is an optional accelerator
+    import msgspec
+
+    class StarshipRaw(msgspec.Struct, omit_defaults=True):
+        """Wire layout of one Starship JSON record.
+
+        Fixed-layout struct with C-level field access: decoding skips
+        the intermediate dict and per-key hashing entirely, and the
+        tuple types enforce vector shapes during the decode.
+        """
+
+        timestamp: float
+        vehicle_id: str
+        stage_id: str
+        position: tuple[float, float, float] = _ZERO3
+        velocity: tuple[float, float, float] = _ZERO3
+        acceleration: tuple[float, float, float] = _ZERO3
+        attitude_q: tuple[float, float, float, float] = _QUAT_IDENT
+        angular_rates: tuple[float, float, float] = _ZERO3
+        angular_accel: tuple[float, float, float] = _ZERO3
+        com: tuple[float, float, float] = _ZERO3
+        raptor_count: int = 33
+        thrust: float = 0.0
+        throttle: float = 100.0
+        propellant_mass: float = 0.0
+        altitude: float = 0.0
+        mach: float = 0.0
+        dynamic_pressure: float = 0.0
+        flight_mode: str = "PRELAUNCH"
+        control_gains: dict[str, float] = {}
+
+    _WIRE_DECODER = msgspec.json.Decoder(StarshipRaw)
+except ImportError:
+    msgspec = None
+    _WIRE_DECODER = None
+
+# Hoisted categorical constants: validation runs per record, so
+# rebuilding these as list literals there costs an allocation plus an
+# O(n) scan per membership test; frozensets give hashed O(1)
+# membership. Required fields (timestamp, vehicle_id, stage_id) are
+# enforced by the parser's direct key access.
+_VALID_STAGES = frozenset(("Booster", "Ship"))
+_VALID_FLIGHT_MODES = frozenset(
+    (
+        "PRELAUNCH",
+        "ASCENT",
+        "STAGE_SEP",
+        "COAST",
+        "BOOSTBACK",
+        "REENTRY",
+        "LANDING",
+        "ABORT",
+    )
+)
+
+# Slices into StarshipTelemetrySchema.dyn_vec: the fixed-shape
+# rigid-body state packs into one contiguous float64 buffer instead of
+# a dict of boxed-float lists, so a parsed record costs one array
+# allocation and validators read slices rather than hashed lookups.
+POS = slice(0, 3)
+VEL = slice(3, 6)
+ACC = slice(6, 9)
+QUAT = slice(9, 13)
+ANG_VEL = slice(13, 16)
+ANG_ACC = slice(16, 19)
+COM = slice(19, 22)
+_DYN_LEN = 22
+
+
+def _new_dyn_vec() -> np.ndarray:
+    vec = np.zeros(_DYN_LEN)
+    vec[QUAT.start] = 1.0  # identity quaternion
+    return vec
+
+
+@dataclass(slots=True)
+class StarshipTelemetrySchema:
+    """Starship telemetry data schema.
+
+    Attributes:
+        timestamp: Mission elapsed time (seconds)
+        vehicle_id: Vehicle identifier (e.g., "Starship_S25")
+        stage_id: Stage identifier ("Booster" or "Ship")
+        dyn_vec: Packed rigid-body state; read with the module slice
+            constants (``POS``, ``VEL``, ``ACC``, ``QUAT``,
+            ``ANG_VEL``, ``ANG_ACC``, ``COM``)
+        propulsion_data: Raptor engine telemetry
+        aero_data: Aerodynamic state (altitude, Mach, dynamic pressure)
+        gnc_data: Flight mode and control data
+    """
+
+    timestamp: float
+    vehicle_id: str
+    stage_id: str
+    dyn_vec: np.ndarray = field(default_factory=_new_dyn_vec)
+    propulsion_data: dict[str, Any] = field(default_factory=dict)
+    aero_data: dict[str, Any] = field(default_factory=dict)
+    gnc_data: dict[str, Any] = field(default_factory=dict)
+
+
+# parse_telemetry body, compiled once at import. Generating the
+# function keeps every field key and default pre-bound in one flat
+# body — no per-call default construction or re-built key strings —
+# while leaving the field list readable here as source.
+_PARSE_SRC = '''
+def _parse(raw):
+    t = StarshipTelemetrySchema(
+        timestamp=float(raw["timestamp"]),
+        vehicle_id=intern(str(raw["vehicle_id"])),
+        stage_id=intern(str(raw["stage_id"])),
+        propulsion_data={
+            "raptor_count": raw.get("raptor_count", 33),
+            "thrust_kn": raw.get("thrust", 0.0),
+            "throttle_pct": raw.get("throttle", 100.0),
+            "propellant_mass_kg": raw.get("propellant_mass", 0.0),
+        },
+        aero_data={
+            "altitude_m": raw.get("altitude", 0.0),
+            "mach": raw.get("mach", 0.0),
+            "dynamic_pressure_kpa": raw.get("dynamic_pressure", 0.0),
+        },
+        gnc_data={
+            "flight_mode": intern(raw.get("flight_mode", "PRELAUNCH")),
+            "control_gains": raw.get("control_gains", _EMPTY_DICT),
+        },
+    )
+    q = raw.get("attitude_q", _DEF_QUAT)
+    if len(q) != 4:
+        raise ValueError("Quaternion must have 4 components")
+    dyn = t.dyn_vec
+    dyn[POS] = raw.get("position", _DEF_VEC)
+    dyn[VEL] = raw.get("velocity", _DEF_VEC)
+    dyn[ACC] = raw.get("acceleration", _DEF_VEC)
+    dyn[QUAT] = q
+    dyn[ANG_VEL] = raw.get("angular_rates", _DEF_VEC)
+    dyn[ANG_ACC] = raw.get("angular_accel", _DEF_VEC)
+    dyn[COM] = raw.get("com", _DEF_VEC)
+    return t
+'''
+
+_parse_ns: dict[str, Any] = {
+    "StarshipTelemetrySchema": StarshipTelemetrySchema,
+    "POS": POS,
+    "VEL": VEL,
+    "ACC": ACC,
+    "QUAT": QUAT,
+    "ANG_VEL": ANG_VEL,
+    "ANG_ACC": ANG_ACC,
+    "COM": COM,
+    "_DEF_VEC": _ZERO3,
+    "_DEF_QUAT": _QUAT_IDENT,
+    "_EMPTY_DICT": _EMPTY_DICT,
+    # Categorical strings intern at parse: every record with the same
+    # stage or mode shares one object, so the frozenset membership
+    # checks hit the pointer-equality shortcut before hashing compares.
+    "intern": sys.intern,
+}
+exec(compile(_PARSE_SRC, "<starship_parse>", "exec"), _parse_ns)
+_PARSE = _parse_ns["_parse"]
+
+
+def _numeric_mask(timestamp, mass, altitude, mach, raptor_count, q) -> int:
+    """Run the numeric range checks, returning the error bitmask."""
+    if _c_validate_numeric is not None:
+        return _c_validate_numeric(
+            timestamp, mass, altitude, mach, raptor_count, q[0], q[1], q[2], q[3]
+        )
+    mask = 0
+    if timestamp < 0:
+        mask |= _ERR_TIMESTAMP
+    if mass < 0 or mass > 5_000_000:
+        mask |= _ERR_MASS
+    if altitude < -500 or altitude > 200_000:
+        mask |= _ERR_ALTITUDE
+    if mach < 0 or mach > 30:
+        mask |= _ERR_MACH
+    if raptor_count < 0 or raptor_count > 33:
+        mask |= _ERR_RAPTOR
+    # The compiled norm runs as four scalar multiplies and a sqrt with
+    # no boxed intermediates; the generator reduction is the
+    # interpreter fallback. The component count is enforced at parse,
+    # so q always has four elements here.
+    if _quat_norm_err is not None:
+        if abs(_quat_norm_err(q[0], q[1], q[2], q[3])) > 0.01:
+            mask |= _ERR_QUAT
+    elif abs(sum(qi**2 for qi in q) ** 0.5 - 1.0) > 0.01:
+        mask |= _ERR_QUAT
+    return mask
+
+
+def _validate_batch_mask(timestamps, masses, alts, machs, raptor_counts, quats):
+    """Compute the per-record error bitmask for a whole batch at once.
+
+    Same bit layout as :func:`_numeric_mask`, but every check runs as a
+    branchless vectorized comparison over the stacked field arrays —
+    one shift-or per rule instead of interpreter branches per record.
+
+    Returns:
+        uint32 array with one mask per record; zero means valid
+    """
+    mask = (timestamps < 0).astype(np.uint32)  # _ERR_TIMESTAMP
+    mask |= ((masses < 0) | (masses > 5_000_000)).astype(np.uint32) << 1  # _ERR_MASS
+    mask |= ((alts < -500) | (alts > 200_000)).astype(np.uint32) << 2  # _ERR_ALTITUDE
+    mask |= ((machs < 0) | (machs > 30)).astype(np.uint32) << 3  # _ERR_MACH
+    mask |= ((raptor_counts < 0) | (raptor_counts > 33)).astype(np.uint32) << 4  # _ERR_RAPTOR
+    q_norm = np.linalg.norm(quats, axis=1)
+    mask |= (np.abs(q_norm - 1.0) > 0.01).astype(np.uint32) << 5  # _ERR_QUAT
+    return mask
+
+
+def _build_errors(mask, vehicle_id, stage_id, mass, altitude, mach, raptor_count, q, flight_mode):
+    """Decode the numeric bitmask and categorical checks into messages.
+
+    Strings are only formatted for failing checks, so the common valid
+    record allocates nothing beyond the errors list itself.
+    """
+    errors = []
+
+    # Validate timestamp
+    if mask & _ERR_TIMESTAMP:
+        errors.append("Timestamp must be non-negative")
+
+    # Validate vehicle ID format
+    if not vehicle_id.startswith("Starship"):
+        errors.append(f"Invalid vehicle ID format: {vehicle_id}")
+
+    # Validate stage identifier
+    if stage_id not in _VALID_STAGES:
+        errors.append(f"Invalid stage: {stage_id}")
+
+    # Validate propellant mass (full stack loads ~4600t)
+    if mask & _ERR_MASS:
+        errors.append(f"Propellant mass out of range: {mass}kg")
+
+    # Validate altitude (pad level through orbital insertion)
+    if mask & _ERR_ALTITUDE:
+        errors.append(f"Altitude out of range: {altitude}m")
+
+    # Validate Mach number
+    if mask & _ERR_MACH:
+        errors.append(f"Mach number out of range: {mach}")
+
+    # Validate Raptor engine count
+    if mask & _ERR_RAPTOR:
+        errors.append(f"Raptor count out of range: {raptor_count}")
+
+    # Validate quaternion normalization
+    if mask & _ERR_QUAT:
+        q_norm = sum(qi**2 for qi in q) ** 0.5
+        errors.append(f"Quaternion not normalized: ||q|| = {q_norm}")
+
+    # Validate flight mode
+    if flight_mode not in _VALID_FLIGHT_MODES:
+        errors.append(f"Invalid flight mode: {flight_mode}")
+
+    return errors
+
+
+class StarshipTelemetryAdapter:
+    """Adapter for Starship telemetry ingestion via gRPC."""
+
+    def __init__(self, endpoint: str = "localhost:8003"):
+        """Initialize Starship telemetry adapter.
+
+        Args:
+            endpoint: gRPC endpoint for telemetry service
+        """
+        self.endpoint = endpoint
+        self._connected = False
+
+    def connect(self) -> bool:
+        """Establish connection to Starship telemetry service.
+
+        Returns:
+            True if connection successful
+        """
+        # In production, would establish actual gRPC connection
+        self._connected = True
+        return self._connected
+
+    def parse_telemetry(self, raw_data: dict[str, Any]) -> StarshipTelemetrySchema:
+        """Parse raw telemetry data into structured schema.
+
+        Args:
+            raw_data: Raw telemetry dictionary from Starship data stream
+
+        Returns:
+            Parsed telemetry schema
+
+        Raises:
+            ValueError: If schema validation fails
+        """
+        try:
+            return _PARSE(raw_data)
+        except KeyError as e:
+            raise ValueError(f"Missing required field: {e.args[0]}") from e
+
+    def parse_telemetry_bytes(self, raw_bytes: bytes) -> StarshipTelemetrySchema:
+        """Parse one JSON-encoded record straight from wire bytes.
+
+        With msgspec installed the payload decodes into the fixed
+        layout :class:`StarshipRaw` struct — no intermediate dict, no
+        per-key hashing — and the schema fills from struct attributes.
+        Otherwise the bytes decode with orjson (or stdlib json) and go
+        through :meth:`parse_telemetry`.
+
+        Args:
+            raw_bytes: One UTF-8 JSON telemetry record
+
+        Returns:
+            Parsed telemetry schema
+
+        Raises:
+            ValueError: If decoding or schema validation fails
+        """
+        if _WIRE_DECODER is None:
+            data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
+            return self.parse_telemetry(data)
+
+        try:
+            raw = _WIRE_DECODER.decode(raw_bytes)
+        except msgspec.ValidationError as e:
+            raise ValueError(str(e)) from e
+
+        telemetry = StarshipTelemetrySchema(
+            timestamp=raw.timestamp,
+            vehicle_id=raw.vehicle_id,
+            stage_id=raw.stage_id,
+            propulsion_data={
+                "raptor_count": raw.raptor_count,
+                "thrust_kn": raw.thrust,
+                "throttle_pct": raw.throttle,
+                "propellant_mass_kg": raw.propellant_mass,
+            },
+            aero_data={
+                "altitude_m": raw.altitude,
+                "mach": raw.mach,
+                "dynamic_pressure_kpa": raw.dynamic_pressure,
+            },
+            gnc_data={
+                "flight_mode": raw.flight_mode,
+                "control_gains": raw.control_gains,
+            },
+        )
+        dyn = telemetry.dyn_vec
+        dyn[POS] = raw.position
+        dyn[VEL] = raw.velocity
+        dyn[ACC] = raw.acceleration
+        dyn[QUAT] = raw.attitude_q
+        dyn[ANG_VEL] = raw.angular_rates
+        dyn[ANG_ACC] = raw.angular_accel
+        dyn[COM] = raw.com
+        return telemetry
+
+    def validate_schema(
+        self, telemetry: StarshipTelemetrySchema
+    ) -> tuple[bool, Sequence[str]]:
+        """Validate telemetry schema compliance.
+
+        Args:
+            telemetry: Parsed telemetry data
+
+        Returns:
+            Tuple of (is_valid, validation errors). Valid records get
+            a shared empty tuple, so treat the errors as read-only.
+        """
+        mass = telemetry.propulsion_data.get("propellant_mass_kg", 0.0)
+        altitude = telemetry.aero_data.get("altitude_m", 0.0)
+        mach = telemetry.aero_data.get("mach", 0.0)
+        raptor_count = telemetry.propulsion_data.get("raptor_count", 33)
+        q = telemetry.dyn_vec[QUAT]
+
+        # The numeric range checks collapse into one error bitmask; the
+        # compiled validator runs them as ~10 compare-and-branch ops on
+        # unboxed doubles. Error strings are built only for set bits,
+        # so the valid path formats nothing.
+        mask = _numeric_mask(telemetry.timestamp, mass, altitude, mach, raptor_count, q)
+        flight_mode = telemetry.gnc_data.get("flight_mode", "PRELAUNCH")
+        if (
+            not mask
+            and telemetry.vehicle_id.startswith("Starship")
+            and telemetry.stage_id in _VALID_STAGES
+            and flight_mode in _VALID_FLIGHT_MODES
+        ):
+            return _OK
+
+        return False, _build_errors(
+            mask,
+            telemetry.vehicle_id,
+            telemetry.stage_id,
+            mass,
+            altitude,
+            mach,
+            raptor_count,
+            q,
+            flight_mode,
+        )
+
+    def _parse_and_validate(
+        self, raw_data: dict[str, Any]
+    ) -> tuple[StarshipTelemetrySchema | None, Sequence[str]]:
+        """Validate straight off the wire dict, parsing only on success.
+
+        Fuses :meth:`parse_telemetry` and :meth:`validate_schema` for
+        the batch path: every field is read from ``raw_data`` exactly
+        once, and the nested schema is only materialized for records
+        that pass every check. Output matches running the two public
+        methods back to back.
+
+        Returns:
+            Tuple of (schema or None, validation errors)
+        """
+        try:
+            timestamp = float(raw_data["timestamp"])
+            vehicle_id = sys.intern(str(raw_data["vehicle_id"]))
+            stage_id = sys.intern(str(raw_data["stage_id"]))
+        except KeyError as e:
+            raise ValueError(f"Missing required field: {e.args[0]}") from e
+
+        q = raw_data.get("attitude_q", _QUAT_IDENT)
+        if len(q) != 4:
+            raise ValueError("Quaternion must have 4 components")
+
+        mass = raw_data.get("propellant_mass", 0.0)
+        altitude = raw_data.get("altitude", 0.0)
+        mach = raw_data.get("mach", 0.0)
+        raptor_count = raw_data.get("raptor_count", 33)
+        flight_mode = sys.intern(raw_data.get("flight_mode", "PRELAUNCH"))
+
+        mask = _numeric_mask(timestamp, mass, altitude, mach, raptor_count, q)
+        if (
+            mask
+            or stage_id not in _VALID_STAGES
+            or flight_mode not in _VALID_FLIGHT_MODES
+            or not vehicle_id.startswith("Starship")
+        ):
+            return None, _build_errors(
+                mask, vehicle_id, stage_id, mass, altitude, mach,
+                raptor_count, q, flight_mode,
+            )
+        return _PARSE(raw_data), ()
+
+    def ingest_batch(self, raw_batch: list[dict[str, Any]]) -> tuple[int, int, list[str]]:
+        """Ingest batch of telemetry data.
+
+        Args:
+            raw_batch: List of raw telemetry dictionaries
+
+        Returns:
+            Tuple of (successful_count, failed_count, error_messages)
+        """
+        if len(raw_batch) >= _VECTORIZE_MIN:
+            return self.ingest_batch_vectorized(raw_batch)
+
+        successful = 0
+        failed = 0
+        errors = []
+
+        for i, raw_data in enumerate(raw_batch):
+            try:
+                telemetry, validation_errors = self._parse_and_validate(raw_data)
+
+                if telemetry is not None:
+                    successful += 1
+                else:
+                    failed += 1
+                    errors.extend([f"Record {i}: {err}" for err in validation_errors])
+            except Exception as e:
+                failed += 1
+                errors.append(f"Record {i}: {str(e)}")
+
+        return successful, failed, errors
+
+    def ingest_batch_vectorized(
+        self, raw_batch: list[dict[str, Any]]
+    ) -> tuple[int, int, list[str]]:
+        """Ingest a batch with NumPy bulk validation.
+
+        One pass stacks the scalar and vector fields into
+        structure-of-arrays buffers; every numeric range check then
+        runs as a vectorized boolean mask over the whole batch. Only
+        records flagged by a mask (or whose fields could not be stacked
+        at all) take the per-record path to produce their error
+        messages, so the output matches :meth:`ingest_batch` exactly.
+
+        Args:
+            raw_batch: List of raw telemetry dictionaries
+
+        Returns:
+            Tuple of (successful_count, failed_count, error_messages)
+        """
+        if not raw_batch:
+            return self.ingest_batch(raw_batch)
+
+        n = len(raw_batch)
+        suspect = np.zeros(n, dtype=bool)
+        timestamps = np.zeros(n)
+        quats = np.zeros((n, 4))
+        quats[:, 0] = 1.0
+        masses = np.zeros(n)
+        machs = np.zeros(n)
+        alts = np.zeros(n)
+        raptor_counts = np.full(n, 33.0)
+        # Scratch slot for the 3-vectors the checks below never read:
+        # assigning them enforces the same shape/numeric constraints
+        # the parser's dyn_vec writes would, so malformed vectors fail
+        # here exactly as they do on the scalar path.
+        vec3 = np.empty(3)
+
+        for i, raw_data in enumerate(raw_batch):
+            try:
+                timestamps[i] = float(raw_data["timestamp"])
+                if not str(raw_data["vehicle_id"]).startswith("Starship"):
+                    suspect[i] = True
+                    continue
+                if str(raw_data["stage_id"]) not in _VALID_STAGES:
+                    suspect[i] = True
+                    continue
+                if raw_data.get("flight_mode", "PRELAUNCH") not in _VALID_FLIGHT_MODES:
+                    suspect[i] = True
+                    continue
+                quats[i] = raw_data.get("attitude_q", _QUAT_IDENT)
+                vec3[:] = raw_data.get("position", _ZERO3)
+                vec3[:] = raw_data.get("velocity", _ZERO3)
+                vec3[:] = raw_data.get("acceleration", _ZERO3)
+                vec3[:] = raw_data.get("angular_rates", _ZERO3)
+                vec3[:] = raw_data.get("angular_accel", _ZERO3)
+                vec3[:] = raw_data.get("com", _ZERO3)
+                masses[i] = raw_data.get("propellant_mass", 0.0)
+                machs[i] = raw_data.get("mach", 0.0)
+                alts[i] = raw_data.get("altitude", 0.0)
+                raptor_counts[i] = raw_data.get("raptor_count", 33)
+            except (KeyError, TypeError, ValueError):
+                suspect[i] = True
+
+        record_masks = _validate_batch_mask(
+            timestamps, masses, alts, machs, raptor_counts, quats
+        )
+        invalid = suspect | (record_masks != 0)
+
+        failing = np.nonzero(invalid)[0]
+        errors: list[str] = []
+        for i in failing:
+            raw_data = raw_batch[i]
+            try:
+                _, validation_errors = self._parse_and_validate(raw_data)
+                errors.extend(f"Record {i}: {err}" for err in validation_errors)
+            except Exception as e:
+                errors.append(f"Record {i}: {str(e)}")
+
+        failed = int(failing.shape[0])
+        return n - failed, failed, errors
+
+    def export_quasim_format(self, telemetry: StarshipTelemetrySchema) -> dict[str, Any]:
+        """Export telemetry in QuASIM internal format.
+
+        Args:
+            telemetry: Starship telemetry data
+
+        Returns:
+            Dictionary in QuASIM format
+        """
+        return {
+            "timestamp": telemetry.timestamp,
+            "source": f"{telemetry.vehicle_id}_{telemetry.stage_id}",
+            "state": {
+                "position": telemetry.dyn_vec[POS].tolist(),
+                "velocity": telemetry.dyn_vec[VEL].tolist(),
+                "attitude": telemetry.dyn_vec[QUAT].tolist(),
+            },
+            "propulsion": telemetry.propulsion_data,
+            "aero": telemetry.aero_data,
+            "gnc": telemetry.gnc_data,
+        }
+
+    def disconnect(self) -> None:
+        """Disconnect from telemetry service."""
+        self._connected = False